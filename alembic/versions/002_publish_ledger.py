@@ -0,0 +1,40 @@
+"""Publish ledger
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'publish_ledger',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_id', sa.Integer(), nullable=False),
+        sa.Column('platform', sa.String(), nullable=False),
+        sa.Column('step', sa.String(), nullable=False),
+        sa.Column('external_id', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['content_id'], ['generated_content.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('content_id', 'step', name='uq_publish_ledger_content_step')
+    )
+    op.create_index(op.f('ix_publish_ledger_id'), 'publish_ledger', ['id'], unique=False)
+    op.create_index(op.f('ix_publish_ledger_content_id'), 'publish_ledger', ['content_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_publish_ledger_content_id'), table_name='publish_ledger')
+    op.drop_index(op.f('ix_publish_ledger_id'), table_name='publish_ledger')
+    op.drop_table('publish_ledger')
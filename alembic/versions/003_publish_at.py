@@ -0,0 +1,27 @@
+"""Scheduled publishing slot
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('generated_content', sa.Column('publish_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_generated_content_publish_at'), 'generated_content', ['publish_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_generated_content_publish_at'), table_name='generated_content')
+    op.drop_column('generated_content', 'publish_at')
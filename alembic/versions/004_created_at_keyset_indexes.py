@@ -0,0 +1,27 @@
+"""Keyset pagination indexes on (created_at, id)
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Scanned backwards for ORDER BY created_at DESC, id DESC
+    op.create_index('ix_source_content_created_at_id', 'source_content', ['created_at', 'id'], unique=False)
+    op.create_index('ix_generated_content_created_at_id', 'generated_content', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_generated_content_created_at_id', table_name='generated_content')
+    op.drop_index('ix_source_content_created_at_id', table_name='source_content')
@@ -0,0 +1,94 @@
+"""Query-shaped indexes and JSONB metadata
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PENDING = sa.text("approval_status = 'PENDING_APPROVAL'")
+SCHEDULED = sa.text("approval_status = 'APPROVED' AND publish_at IS NOT NULL")
+
+
+def upgrade() -> None:
+    # metadata: JSON -> JSONB (rewrites the table)
+    op.alter_column(
+        'source_content', 'metadata',
+        type_=postgresql.JSONB(),
+        postgresql_using='metadata::jsonb'
+    )
+    # Newsletter subject line and other per-platform extras
+    op.add_column('generated_content', sa.Column('metadata', postgresql.JSONB(), nullable=True))
+    
+    # Build indexes without blocking writes on large tables
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_source_content_metadata', 'source_content', ['metadata'],
+            postgresql_using='gin', postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_source_content_status_created_at', 'source_content', ['status', 'created_at'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_generated_content_pending_created_at_id', 'generated_content', ['created_at', 'id'],
+            postgresql_where=PENDING, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_generated_content_approval_status_created_at', 'generated_content',
+            ['approval_status', 'created_at'], postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_generated_content_source_id_approval_status', 'generated_content',
+            ['source_id', 'approval_status'], postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_generated_content_scheduled_publish_at', 'generated_content', ['publish_at'],
+            postgresql_where=SCHEDULED, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_generated_content_scheduled_platform_publish_at', 'generated_content',
+            ['platform', 'publish_at'], postgresql_where=SCHEDULED, postgresql_concurrently=True
+        )
+        # Superseded by the partial scheduler indexes
+        op.drop_index(
+            'ix_generated_content_publish_at', table_name='generated_content',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_generated_content_publish_at', 'generated_content', ['publish_at'],
+            postgresql_concurrently=True
+        )
+        for name, table in [
+            ('ix_generated_content_scheduled_platform_publish_at', 'generated_content'),
+            ('ix_generated_content_scheduled_publish_at', 'generated_content'),
+            ('ix_generated_content_source_id_approval_status', 'generated_content'),
+            ('ix_generated_content_approval_status_created_at', 'generated_content'),
+            ('ix_generated_content_pending_created_at_id', 'generated_content'),
+            ('ix_source_content_status_created_at', 'source_content'),
+            ('ix_source_content_metadata', 'source_content'),
+        ]:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    
+    op.drop_column('generated_content', 'metadata')
+    op.alter_column(
+        'source_content', 'metadata',
+        type_=sa.JSON(),
+        postgresql_using='metadata::json'
+    )
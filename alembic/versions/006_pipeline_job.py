@@ -0,0 +1,47 @@
+"""Pipeline job tracking
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'pipeline_job',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('source_id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.String(), nullable=True),
+        sa.Column('stage', sa.Enum('QUEUED', 'INGESTION', 'GENERATION', 'NOTIFICATION', 'PUBLISHING', name='pipelinestage'), nullable=False),
+        # Reuses the source_content status type
+        sa.Column('status', postgresql.ENUM('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED', name='contentstatus', create_type=False), nullable=False),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('stages', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['source_id'], ['source_content.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_pipeline_job_id'), 'pipeline_job', ['id'], unique=False)
+    op.create_index(op.f('ix_pipeline_job_source_id'), 'pipeline_job', ['source_id'], unique=False)
+    op.create_index(op.f('ix_pipeline_job_task_id'), 'pipeline_job', ['task_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_pipeline_job_task_id'), table_name='pipeline_job')
+    op.drop_index(op.f('ix_pipeline_job_source_id'), table_name='pipeline_job')
+    op.drop_index(op.f('ix_pipeline_job_id'), table_name='pipeline_job')
+    op.drop_table('pipeline_job')
+    sa.Enum(name='pipelinestage').drop(op.get_bind(), checkfirst=True)
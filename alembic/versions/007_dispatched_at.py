@@ -0,0 +1,81 @@
+"""Keep publish slots after dispatch
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SCHEDULED = sa.text("approval_status = 'APPROVED' AND publish_at IS NOT NULL")
+DUE = sa.text("approval_status = 'APPROVED' AND publish_at IS NOT NULL AND dispatched_at IS NULL")
+POSTED = sa.text("approval_status IN ('APPROVED', 'PUBLISHED')")
+LAST_SLOT = sa.text("greatest(publish_at, published_at)")
+
+
+def upgrade() -> None:
+    op.add_column('generated_content', sa.Column('dispatched_at', sa.DateTime(timezone=True), nullable=True))
+    
+    # Approved rows without a slot were already handed to a publish task
+    # (the scheduler used to clear publish_at on dispatch)
+    op.execute(
+        "UPDATE generated_content SET dispatched_at = coalesce(approved_at, now()) "
+        "WHERE approval_status = 'APPROVED' AND publish_at IS NULL"
+    )
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_generated_content_due_publish_at', 'generated_content', ['publish_at'],
+            postgresql_where=DUE, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_generated_content_platform_last_slot', 'generated_content',
+            ['platform', LAST_SLOT], postgresql_where=POSTED, postgresql_concurrently=True
+        )
+        # Superseded: dispatched rows now keep publish_at, and the last slot
+        # also counts published rows
+        op.drop_index(
+            'ix_generated_content_scheduled_publish_at', table_name='generated_content',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_generated_content_scheduled_platform_publish_at', table_name='generated_content',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_generated_content_scheduled_publish_at', 'generated_content', ['publish_at'],
+            postgresql_where=SCHEDULED, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_generated_content_scheduled_platform_publish_at', 'generated_content',
+            ['platform', 'publish_at'], postgresql_where=SCHEDULED, postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_generated_content_platform_last_slot', table_name='generated_content',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_generated_content_due_publish_at', table_name='generated_content',
+            postgresql_concurrently=True
+        )
+    
+    # Dispatched rows had their slot cleared before this revision
+    op.execute(
+        "UPDATE generated_content SET publish_at = NULL "
+        "WHERE approval_status = 'APPROVED' AND dispatched_at IS NOT NULL"
+    )
+    op.drop_column('generated_content', 'dispatched_at')
@@ -0,0 +1,25 @@
+from app.config import settings
+
+_client = None
+
+
+def get_llm_client():
+    """
+    Shared OpenAI client, created on first use.
+    
+    The SDK is imported here rather than at module level so processes that
+    never call the LLM (the API, publishing workers) don't load it.
+    """
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    return _client
+
+
+def close_llm_client() -> None:
+    """Close the client's connection pool (worker process shutdown)"""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
@@ -1,5 +1,4 @@
-from openai import OpenAI
-from app.config import settings
+from app.ai.llm import get_llm_client
 from app.ai.prompts import CONTEXT_ANALYZER_PROMPT
 import structlog
 
@@ -11,7 +10,7 @@ def analyze_context(transcript: str, video_metadata: dict = None) -> dict:
     Analyze video transcript to extract key insights and context.
     This is the first node in the LangGraph workflow.
     """
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_llm_client()
     
     # Build the analysis prompt
     prompt = CONTEXT_ANALYZER_PROMPT.format(transcript=transcript)
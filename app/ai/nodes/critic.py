@@ -1,5 +1,4 @@
-from openai import OpenAI
-from app.config import settings
+from app.ai.llm import get_llm_client
 from app.ai.prompts import CRITIC_PROMPT
 import structlog
 
@@ -16,7 +15,7 @@ def critique_and_refine(
     Second LLM pass to review and refine generated content.
     Validates against style guide and ensures quality.
     """
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_llm_client()
     
     prompt = CRITIC_PROMPT.format(
         context_analysis=context_analysis,
@@ -1,5 +1,4 @@
-from openai import OpenAI
-from app.config import settings
+from app.ai.llm import get_llm_client
 from app.ai.prompts import LINKEDIN_GENERATOR_PROMPT
 import structlog
 
@@ -11,7 +10,7 @@ def generate_linkedin_post(context_analysis: str, style_guide: str) -> dict:
     Generate LinkedIn post from analyzed content.
     Creates professional, storytelling-style posts optimized for LinkedIn engagement.
     """
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_llm_client()
     
     prompt = LINKEDIN_GENERATOR_PROMPT.format(
         context_analysis=context_analysis,
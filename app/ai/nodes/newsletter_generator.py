@@ -1,5 +1,4 @@
-from openai import OpenAI
-from app.config import settings
+from app.ai.llm import get_llm_client
 from app.ai.prompts import NEWSLETTER_GENERATOR_PROMPT
 import structlog
 
@@ -11,7 +10,7 @@ def generate_newsletter(context_analysis: str, style_guide: str) -> dict:
     Generate newsletter/email content from analyzed content.
     Creates educational, well-structured email content with subject line.
     """
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_llm_client()
     
     prompt = NEWSLETTER_GENERATOR_PROMPT.format(
         context_analysis=context_analysis,
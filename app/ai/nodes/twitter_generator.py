@@ -1,5 +1,4 @@
-from openai import OpenAI
-from app.config import settings
+from app.ai.llm import get_llm_client
 from app.ai.prompts import TWITTER_GENERATOR_PROMPT
 import structlog
 import json
@@ -12,7 +11,7 @@ def generate_twitter_thread(context_analysis: str, style_guide: str) -> dict:
     Generate Twitter/X thread from analyzed content.
     Uses Claude 3.5 Sonnet to create engaging, viral-style tweets.
     """
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_llm_client()
     
     prompt = TWITTER_GENERATOR_PROMPT.format(
         context_analysis=context_analysis,
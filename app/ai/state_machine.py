@@ -181,8 +181,20 @@ def create_workflow() -> StateGraph:
     return workflow.compile()
 
 
-# Create compiled workflow instance
-compiled_workflow = create_workflow()
+_compiled_workflow = None
+
+
+def get_compiled_workflow():
+    """
+    Compiled workflow, built once per process.
+    
+    Worker children build it right after fork (app.workers.bootstrap), so
+    the first generation task doesn't pay for it.
+    """
+    global _compiled_workflow
+    if _compiled_workflow is None:
+        _compiled_workflow = create_workflow()
+    return _compiled_workflow
 
 
 def run_content_generation(transcript: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -212,7 +224,7 @@ def run_content_generation(transcript: str, metadata: Dict[str, Any] = None) ->
     }
     
     # Run the workflow
-    final_state = compiled_workflow.invoke(initial_state)
+    final_state = get_compiled_workflow().invoke(initial_state)
     
     logger.info("content_generation_workflow_complete")
     
@@ -1,15 +1,33 @@
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from celery import group
+from sqlalchemy import select, update, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_async_db
+from app.api.pagination import paginate_newest_first, page
+from app.api.sse import subscribe, event_stream
+from app.celery_app import celery_app, PUBLISH_CONTENT, PUBLISH_SOURCE
 from app.models import GeneratedContent, SourceContent, ApprovalStatus, Platform
-from datetime import datetime
+from app.services.scheduling import assign_publish_slot, assign_publish_slots
+from app.services.content_events import (
+    EVENTS_CHANNEL, PREVIEW_LENGTH, content_event, status_changed_event, publish_content_events_async
+)
+from app.services.content_cache import (
+    content_etag, get_cached_content, cache_content, invalidate_content_async
+)
+from app.config import settings
+from datetime import datetime, timezone
 import structlog
+import enum
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger()
 
+BULK_MAX_IDS = 500
+
 
 class ContentResponse(BaseModel):
     id: int
@@ -28,6 +46,45 @@ class ContentResponse(BaseModel):
         from_attributes = True
 
 
+class ContentListItem(BaseModel):
+    """Pending queue entry: a short preview instead of the full body"""
+    id: int
+    source_id: int
+    platform: str
+    preview: str
+    approval_status: str
+    created_at: datetime
+    
+    # Source video info
+    video_title: Optional[str] = None
+    video_url: Optional[str] = None
+    
+    # Full body, only when requested through ?fields=
+    content: Optional[str] = None
+
+
+class ContentListResponse(BaseModel):
+    items: List[ContentListItem]
+    next_cursor: Optional[str] = None
+
+
+# ?fields= names for list items and the columns they select
+LIST_FIELDS = {
+    "id": GeneratedContent.id,
+    "source_id": GeneratedContent.source_id,
+    "platform": GeneratedContent.platform,
+    "preview": func.coalesce(
+        func.substr(GeneratedContent.content, 1, PREVIEW_LENGTH), ""
+    ).label("preview"),
+    "content": GeneratedContent.content,
+    "approval_status": GeneratedContent.approval_status,
+    "created_at": GeneratedContent.created_at,
+    "video_title": SourceContent.title.label("video_title"),
+    "video_url": SourceContent.video_url.label("video_url"),
+}
+DEFAULT_LIST_FIELDS = set(LIST_FIELDS) - {"content"}
+
+
 class ContentUpdateRequest(BaseModel):
     content: str
     content_parts: Optional[str] = None
@@ -37,81 +94,180 @@ class ApprovalRequest(BaseModel):
     approved_by: str = "admin"
 
 
-@router.get("/pending", response_model=List[ContentResponse])
-async def get_pending_content(db: Session = Depends(get_db)):
-    """Get all content pending approval"""
-    try:
-        content_items = db.query(GeneratedContent).join(SourceContent).filter(
-            GeneratedContent.approval_status == ApprovalStatus.PENDING_APPROVAL
-        ).all()
-        
-        response = []
-        for item in content_items:
-            response.append(ContentResponse(
-                id=item.id,
-                source_id=item.source_id,
-                platform=item.platform.value,
-                content=item.content,
-                content_parts=item.content_parts,
-                approval_status=item.approval_status.value,
-                created_at=item.created_at,
-                video_title=item.source.title if hasattr(item, 'source') else None,
-                video_url=item.source.video_url if hasattr(item, 'source') else None,
-            ))
-        
-        logger.info("pending_content_retrieved", count=len(response))
-        return response
-        
-    except Exception as e:
-        logger.error("get_pending_failed", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+class BulkAction(str, enum.Enum):
+    APPROVE = "approve"
+    REJECT = "reject"
 
 
-@router.get("/{content_id}", response_model=ContentResponse)
-async def get_content(content_id: int, db: Session = Depends(get_db)):
-    """Get specific content by ID"""
+class BulkActionRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_IDS)
+    action: BulkAction
+    approved_by: str = "admin"
+
+
+class BulkItemResult(BaseModel):
+    id: int
+    result: str  # "approved", "rejected", "not_found" or "skipped"
+    approval_status: Optional[str] = None
+    publish_at: Optional[datetime] = None
+
+
+class BulkActionResponse(BaseModel):
+    action: BulkAction
+    updated: int
+    job_id: Optional[str] = None  # publishing group, when dispatched immediately
+    results: List[BulkItemResult]
+
+
+@router.get("/pending", response_model=ContentListResponse)
+async def get_pending_content(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    platform: Optional[Platform] = None,
+    source_id: Optional[int] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated subset of item fields"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get content pending approval, newest first.
+    
+    Keyset-paginated on (created_at, id). Bodies are not loaded; each item
+    carries a PREVIEW_LENGTH character preview and its source video, joined
+    in the same query. `fields` selects only the named columns (the source
+    join is skipped unless a video field is requested) and can opt into
+    the full `content` body.
+    """
+    selected = _parse_fields(fields, LIST_FIELDS, DEFAULT_LIST_FIELDS)
+    
     try:
-        content = db.query(GeneratedContent).filter(
-            GeneratedContent.id == content_id
-        ).first()
+        columns = [LIST_FIELDS[name] for name in selected]
+        # The cursor needs both keys even when they aren't returned
+        columns += [
+            LIST_FIELDS[name] for name in ("id", "created_at") if name not in selected
+        ]
         
-        if not content:
-            raise HTTPException(status_code=404, detail="Content not found")
+        query = select(*columns).filter(
+            GeneratedContent.approval_status == ApprovalStatus.PENDING_APPROVAL
+        )
+        if selected & {"video_title", "video_url"}:
+            query = query.outerjoin(SourceContent, GeneratedContent.source_id == SourceContent.id)
         
-        source = db.query(SourceContent).filter(
-            SourceContent.id == content.source_id
-        ).first()
+        if platform:
+            query = query.filter(GeneratedContent.platform == platform)
+        if source_id:
+            query = query.filter(GeneratedContent.source_id == source_id)
         
-        return ContentResponse(
-            id=content.id,
-            source_id=content.source_id,
-            platform=content.platform.value,
-            content=content.content,
-            content_parts=content.content_parts,
-            approval_status=content.approval_status.value,
-            created_at=content.created_at,
-            video_title=source.title if source else None,
-            video_url=source.video_url if source else None,
-        )
+        rows, next_cursor = page((await db.execute(
+            paginate_newest_first(query, GeneratedContent, cursor, limit)
+        )).all(), limit)
+        
+        # Rows go straight to orjson (enums and datetimes are native to it)
+        items = [
+            {name: value for name, value in row._mapping.items() if name in selected}
+            for row in rows
+        ]
+        
+        logger.info("pending_content_retrieved", count=len(items))
+        return ORJSONResponse({"items": items, "next_cursor": next_cursor})
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("get_content_failed", content_id=content_id, error=str(e))
+        logger.error("get_pending_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _parse_fields(fields: Optional[str], allowed: dict, default: set) -> set:
+    """Validate a ?fields= sparse fieldset"""
+    if not fields:
+        return default
+    
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = selected - allowed.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}; allowed: {', '.join(allowed)}"
+        )
+    
+    return selected
+
+
+@router.get("/events")
+async def stream_content_events(request: Request):
+    """
+    Server-sent `content` events for the approval queue and dashboard.
+    
+    Each event is "created", "updated" or "status_changed" with the item
+    in pending-list shape and its previous status, so clients patch their
+    lists and counters instead of re-fetching them.
+    """
+    pubsub = await subscribe(EVENTS_CHANNEL)
+    return event_stream(request, pubsub, "content")
+
+
+@router.get("/{content_id}", response_model=ContentResponse)
+async def get_content(content_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get specific content by ID.
+    
+    The serialized response is cached in Redis until the content changes
+    and carries a strong ETag; a matching If-None-Match gets a 304 without
+    touching the database when the entry is cached.
+    """
+    body = await get_cached_content(content_id)
+    
+    if body is None:
+        try:
+            content = await db.get(
+                GeneratedContent, content_id, options=[joinedload(GeneratedContent.source)]
+            )
+            
+            if not content:
+                raise HTTPException(status_code=404, detail="Content not found")
+            
+            source = content.source
+            
+            body = ContentResponse(
+                id=content.id,
+                source_id=content.source_id,
+                platform=content.platform.value,
+                content=content.content,
+                content_parts=content.content_parts,
+                approval_status=content.approval_status.value,
+                created_at=content.created_at,
+                video_title=source.title if source else None,
+                video_url=source.video_url if source else None,
+            ).model_dump_json()
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("get_content_failed", content_id=content_id, error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+        
+        await cache_content(content_id, body)
+    
+    etag = content_etag(body)
+    # Browsers keep the body and revalidate it on every fetch
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.put("/{content_id}", response_model=ContentResponse)
 async def update_content(
     content_id: int,
     update: ContentUpdateRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update/edit generated content"""
     try:
-        content = db.query(GeneratedContent).filter(
-            GeneratedContent.id == content_id
-        ).first()
+        content = await db.get(GeneratedContent, content_id)
         
         if not content:
             raise HTTPException(status_code=404, detail="Content not found")
@@ -121,14 +277,20 @@ async def update_content(
         if update.content_parts:
             content.content_parts = update.content_parts
         
-        db.commit()
-        db.refresh(content)
+        await db.commit()
+        await db.refresh(content)
         
         logger.info("content_updated", content_id=content_id)
         
-        source = db.query(SourceContent).filter(
-            SourceContent.id == content.source_id
-        ).first()
+        await invalidate_content_async([content_id])
+        
+        source = await db.get(SourceContent, content.source_id)
+        
+        await publish_content_events_async([content_event(
+            "updated", content,
+            video_title=source.title if source else None,
+            video_url=source.video_url if source else None
+        )])
         
         return ContentResponse(
             id=content.id,
@@ -153,34 +315,54 @@ async def update_content(
 async def approve_content(
     content_id: int,
     approval: ApprovalRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Approve content and trigger publishing"""
     try:
-        content = db.query(GeneratedContent).filter(
-            GeneratedContent.id == content_id
-        ).first()
+        content = await db.get(GeneratedContent, content_id)
         
         if not content:
             raise HTTPException(status_code=404, detail="Content not found")
         
         # Update approval status
+        previous_status = content.approval_status.value
         content.approval_status = ApprovalStatus.APPROVED
         content.approved_by = approval.approved_by
         content.approved_at = datetime.utcnow()
         
-        db.commit()
+        # Reserve a rate-aware slot; the scheduler publishes it when due
+        if settings.SCHEDULED_PUBLISHING_ENABLED:
+            content.publish_at = await assign_publish_slot(db, content.platform)
+            content.dispatched_at = None
+        else:
+            # Claimed for the publish task sent below, so publish_source skips it
+            content.dispatched_at = datetime.now(timezone.utc)
+        
+        await db.commit()
         
         logger.info(
             "content_approved",
             content_id=content_id,
             platform=content.platform.value,
-            approved_by=approval.approved_by
+            approved_by=approval.approved_by,
+            publish_at=content.publish_at.isoformat() if content.publish_at else None
         )
         
-        # Trigger publishing worker
-        from app.workers.publishing import publish_content
-        publish_content.delay(content_id)
+        await invalidate_content_async([content_id])
+        await publish_content_events_async([
+            content_event("status_changed", content, previous_status=previous_status)
+        ])
+        
+        if content.publish_at:
+            return {
+                "status": "approved",
+                "content_id": content_id,
+                "publish_at": content.publish_at.isoformat(),
+                "message": "Content approved and scheduled for publishing"
+            }
+        
+        # Trigger publishing worker (the item was claimed for it above)
+        celery_app.send_task(PUBLISH_CONTENT, args=(content_id,))
         
         return {
             "status": "approved",
@@ -196,21 +378,25 @@ async def approve_content(
 
 
 @router.post("/{content_id}/reject")
-async def reject_content(content_id: int, db: Session = Depends(get_db)):
+async def reject_content(content_id: int, db: AsyncSession = Depends(get_async_db)):
     """Reject generated content"""
     try:
-        content = db.query(GeneratedContent).filter(
-            GeneratedContent.id == content_id
-        ).first()
+        content = await db.get(GeneratedContent, content_id)
         
         if not content:
             raise HTTPException(status_code=404, detail="Content not found")
         
+        previous_status = content.approval_status.value
         content.approval_status = ApprovalStatus.REJECTED
-        db.commit()
+        await db.commit()
         
         logger.info("content_rejected", content_id=content_id)
         
+        await invalidate_content_async([content_id])
+        await publish_content_events_async([
+            content_event("status_changed", content, previous_status=previous_status)
+        ])
+        
         return {
             "status": "rejected",
             "content_id": content_id,
@@ -222,3 +408,141 @@ async def reject_content(content_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         logger.error("reject_content_failed", content_id=content_id, error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/bulk", response_model=BulkActionResponse)
+async def bulk_content_action(
+    request: BulkActionRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Approve or reject many items at once.
+    
+    Only PENDING_APPROVAL items change; the rest are reported as skipped
+    (or not_found). The change is one UPDATE in one transaction, approved
+    items get consecutive per-platform slots (or are published as one
+    Celery group when scheduling is off), and one result is returned per id.
+    """
+    ids = list(dict.fromkeys(request.ids))
+    approve = request.action == BulkAction.APPROVE
+    new_status = ApprovalStatus.APPROVED if approve else ApprovalStatus.REJECTED
+    
+    try:
+        rows = {row.id: row for row in (await db.execute(
+            select(
+                GeneratedContent.id,
+                GeneratedContent.source_id,
+                GeneratedContent.platform,
+                GeneratedContent.approval_status,
+                GeneratedContent.created_at,
+                func.substr(GeneratedContent.content, 1, PREVIEW_LENGTH).label("preview")
+            ).filter(GeneratedContent.id.in_(ids))
+        )).all()}
+        
+        eligible = [
+            content_id for content_id in ids
+            if content_id in rows and rows[content_id].approval_status == ApprovalStatus.PENDING_APPROVAL
+        ]
+        
+        values = {"approval_status": new_status}
+        slots = {}
+        if approve:
+            values["approved_by"] = request.approved_by
+            values["approved_at"] = datetime.utcnow()
+            
+            if settings.SCHEDULED_PUBLISHING_ENABLED and eligible:
+                # Platforms in a fixed order so concurrent bulk requests take
+                # the slot locks in the same order
+                for platform in sorted({rows[i].platform for i in eligible}, key=lambda p: p.value):
+                    platform_ids = [i for i in eligible if rows[i].platform == platform]
+                    slots.update(zip(
+                        platform_ids,
+                        await assign_publish_slots(db, platform, len(platform_ids))
+                    ))
+                values["publish_at"] = case(slots, value=GeneratedContent.id)
+            else:
+                # Claimed for the publish group sent below
+                values["dispatched_at"] = datetime.now(timezone.utc)
+        
+        updated = set()
+        if eligible:
+            # The status guard drops items decided concurrently since the read
+            updated = set((await db.scalars(
+                update(GeneratedContent).where(
+                    GeneratedContent.id.in_(eligible),
+                    GeneratedContent.approval_status == ApprovalStatus.PENDING_APPROVAL
+                ).values(**values).returning(
+                    GeneratedContent.id
+                ).execution_options(synchronize_session=False)
+            )).all())
+        
+        await db.commit()
+        
+    except Exception as e:
+        logger.error("bulk_action_failed", action=request.action.value, count=len(ids), error=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    job_id = None
+    to_publish = [content_id for content_id in ids if content_id in updated and content_id not in slots]
+    if approve and to_publish:
+        group_result = group(
+            celery_app.signature(PUBLISH_CONTENT, args=(content_id,), immutable=True)
+            for content_id in to_publish
+        ).apply_async()
+        # Saved so /webhook/status/{job_id} can report the group's progress
+        group_result.save()
+        job_id = group_result.id
+    
+    await invalidate_content_async(list(updated))
+    await publish_content_events_async([
+        status_changed_event(rows[content_id], new_status)
+        for content_id in ids if content_id in updated
+    ])
+    
+    results = []
+    for content_id in ids:
+        if content_id not in rows:
+            results.append(BulkItemResult(id=content_id, result="not_found"))
+        elif content_id in updated:
+            results.append(BulkItemResult(
+                id=content_id,
+                result=new_status.value,
+                approval_status=new_status.value,
+                publish_at=slots.get(content_id)
+            ))
+        else:
+            results.append(BulkItemResult(
+                id=content_id,
+                result="skipped",
+                approval_status=rows[content_id].approval_status.value
+            ))
+    
+    logger.info(
+        "bulk_action_applied",
+        action=request.action.value,
+        requested=len(ids),
+        updated=len(updated),
+        dispatched=len(to_publish) if approve else 0
+    )
+    
+    return BulkActionResponse(
+        action=request.action,
+        updated=len(updated),
+        job_id=job_id,
+        results=results
+    )
+
+
+@router.post("/source/{source_id}/publish")
+async def publish_source_content(source_id: int):
+    """Publish all approved content of a source concurrently"""
+    task = celery_app.send_task(PUBLISH_SOURCE, args=(source_id,))
+    
+    logger.info("source_publish_queued", source_id=source_id, task_id=task.id)
+    
+    return {
+        "status": "queued",
+        "source_id": source_id,
+        "job_id": task.id,
+        "message": "Approved content queued for publishing; poll /webhook/status/{job_id}"
+    }
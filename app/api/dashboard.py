@@ -1,102 +1,129 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from app.database import get_async_db
+from app.api.pagination import paginate_newest_first, page
 from app.models import SourceContent, GeneratedContent, ContentStatus, ApprovalStatus
+from app.redis_client import get_async_redis
+from app.config import settings
+from typing import Optional
 import structlog
+import json
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger()
 
+STATS_CACHE_KEY = "dashboard:stats"
+
 
 @router.get("/stats")
-async def get_dashboard_stats(db: Session = Depends(get_db)):
-    """Get dashboard statistics"""
+async def get_dashboard_stats(db: AsyncSession = Depends(get_async_db)):
+    """Get dashboard statistics (cached for DASHBOARD_STATS_TTL seconds)"""
     try:
-        # Total videos processed
-        total_videos = db.query(func.count(SourceContent.id)).scalar()
-        
-        # Videos by status
-        pending_videos = db.query(func.count(SourceContent.id)).filter(
-            SourceContent.status == ContentStatus.PENDING
-        ).scalar()
-        
-        processing_videos = db.query(func.count(SourceContent.id)).filter(
-            SourceContent.status == ContentStatus.PROCESSING
-        ).scalar()
-        
-        completed_videos = db.query(func.count(SourceContent.id)).filter(
-            SourceContent.status == ContentStatus.COMPLETED
-        ).scalar()
-        
-        # Generated content stats
-        total_content = db.query(func.count(GeneratedContent.id)).scalar()
-        
-        pending_approval = db.query(func.count(GeneratedContent.id)).filter(
-            GeneratedContent.approval_status == ApprovalStatus.PENDING_APPROVAL
-        ).scalar()
-        
-        approved_content = db.query(func.count(GeneratedContent.id)).filter(
-            GeneratedContent.approval_status == ApprovalStatus.APPROVED
-        ).scalar()
+        cached = await get_async_redis().get(STATS_CACHE_KEY)
+        if cached:
+            # Already serialized; no decode/encode round trip
+            return Response(content=cached, media_type="application/json")
+    except Exception as e:
+        logger.warning("dashboard_stats_cache_unavailable", error=str(e))
+    
+    try:
+        # One GROUP BY per table instead of a COUNT per status
+        video_counts = dict((await db.execute(
+            select(SourceContent.status, func.count(SourceContent.id)).group_by(
+                SourceContent.status
+            )
+        )).all())
         
-        published_content = db.query(func.count(GeneratedContent.id)).filter(
-            GeneratedContent.approval_status == ApprovalStatus.PUBLISHED
-        ).scalar()
+        content_counts = dict((await db.execute(
+            select(GeneratedContent.approval_status, func.count(GeneratedContent.id)).group_by(
+                GeneratedContent.approval_status
+            )
+        )).all())
         
-        return {
+        stats = {
             "videos": {
-                "total": total_videos,
-                "pending": pending_videos,
-                "processing": processing_videos,
-                "completed": completed_videos
+                "total": sum(video_counts.values()),
+                "pending": video_counts.get(ContentStatus.PENDING, 0),
+                "processing": video_counts.get(ContentStatus.PROCESSING, 0),
+                "completed": video_counts.get(ContentStatus.COMPLETED, 0)
             },
             "content": {
-                "total": total_content,
-                "pending_approval": pending_approval,
-                "approved": approved_content,
-                "published": published_content
+                "total": sum(content_counts.values()),
+                "pending_approval": content_counts.get(ApprovalStatus.PENDING_APPROVAL, 0),
+                "approved": content_counts.get(ApprovalStatus.APPROVED, 0),
+                "published": content_counts.get(ApprovalStatus.PUBLISHED, 0)
             }
         }
         
     except Exception as e:
         logger.error("dashboard_stats_failed", error=str(e))
         return {"error": str(e)}
+    
+    try:
+        await get_async_redis().set(
+            STATS_CACHE_KEY, json.dumps(stats), ex=settings.DASHBOARD_STATS_TTL
+        )
+    except Exception as e:
+        logger.warning("dashboard_stats_cache_unavailable", error=str(e))
+    
+    return stats
 
 
 @router.get("/recent")
-async def get_recent_activity(limit: int = 10, db: Session = Depends(get_db)):
-    """Get recent activity"""
+async def get_recent_activity(
+    limit: int = Query(10, ge=1, le=100),
+    videos_cursor: Optional[str] = None,
+    content_cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get recent activity.
+    
+    Only the listed columns are selected (never transcripts, segments or
+    content bodies). Each list is keyset-paginated on (created_at, id);
+    pass the returned next_*_cursor to fetch the following page.
+    """
     try:
-        recent_videos = db.query(SourceContent).order_by(
-            SourceContent.created_at.desc()
-        ).limit(limit).all()
+        recent_videos, next_videos_cursor = page((await db.execute(
+            paginate_newest_first(
+                select(
+                    SourceContent.id,
+                    SourceContent.title,
+                    SourceContent.status,
+                    SourceContent.created_at
+                ),
+                SourceContent,
+                videos_cursor,
+                limit
+            )
+        )).all(), limit)
         
-        recent_content = db.query(GeneratedContent).order_by(
-            GeneratedContent.created_at.desc()
-        ).limit(limit).all()
+        recent_content, next_content_cursor = page((await db.execute(
+            paginate_newest_first(
+                select(
+                    GeneratedContent.id,
+                    GeneratedContent.platform,
+                    GeneratedContent.approval_status,
+                    GeneratedContent.created_at
+                ),
+                GeneratedContent,
+                content_cursor,
+                limit
+            )
+        )).all(), limit)
         
-        return {
-            "recent_videos": [
-                {
-                    "id": v.id,
-                    "title": v.title,
-                    "status": v.status.value,
-                    "created_at": v.created_at.isoformat() if v.created_at else None
-                }
-                for v in recent_videos
-            ],
-            "recent_content": [
-                {
-                    "id": c.id,
-                    "platform": c.platform.value,
-                    "approval_status": c.approval_status.value,
-                    "created_at": c.created_at.isoformat() if c.created_at else None
-                }
-                for c in recent_content
-            ]
-        }
+        # Rows go straight to orjson (enums and datetimes are native to it)
+        return ORJSONResponse({
+            "recent_videos": [dict(v._mapping) for v in recent_videos],
+            "recent_content": [dict(c._mapping) for c in recent_content],
+            "next_videos_cursor": next_videos_cursor,
+            "next_content_cursor": next_content_cursor
+        })
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("recent_activity_failed", error=str(e))
         return {"error": str(e)}
@@ -0,0 +1,51 @@
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from app.redis_client import get_async_redis
+from app.config import settings
+import json
+
+
+async def subscribe(channel: str):
+    """
+    Subscribe to a Redis channel.
+
+    Call this before reading any initial snapshot from the database so no
+    message published in between is missed.
+    """
+    pubsub = get_async_redis().pubsub()
+    await pubsub.subscribe(channel)
+    return pubsub
+
+
+def event_stream(request: Request, pubsub, event: str, initial: list = ()) -> StreamingResponse:
+    """
+    Server-sent events response relaying every message of pubsub as `event`.
+
+    The initial payloads are sent first. The subscription is released when
+    the client disconnects.
+    """
+    return StreamingResponse(
+        _relay(request, pubsub, event, initial),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _relay(request: Request, pubsub, event: str, initial: list):
+    try:
+        for payload in initial:
+            yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+        while not await request.is_disconnected():
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=settings.SSE_KEEPALIVE_INTERVAL
+            )
+            if message is None:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keepalive\n\n"
+                continue
+
+            yield f"event: {event}\ndata: {message['data']}\n\n"
+    finally:
+        await pubsub.reset()
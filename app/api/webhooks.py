@@ -1,9 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from pydantic import BaseModel, HttpUrl
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models import SourceContent, ContentStatus
-from app.workers.ingestion import ingest_video
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.models import SourceContent, ContentStatus, PipelineJob
+from app.api.sse import subscribe, event_stream
+from app.services.pipeline_jobs import serialize_job, EVENTS_CHANNEL
+from app.services.admission import admission_decision, defer_pipeline_async, DEFER, REJECT
+from app.workers.pipeline import start_pipeline
+from app.celery_app import celery_app
+from app.config import settings
+from typing import Optional
+import asyncio
 import structlog
 import re
 
@@ -16,7 +24,8 @@ class YouTubeWebhookPayload(BaseModel):
 
 
 class WebhookResponse(BaseModel):
-    job_id: str
+    job_id: Optional[str] = None
+    source_id: int
     video_url: str
     status: str
     message: str
@@ -38,10 +47,18 @@ def extract_video_id(url: str) -> str:
     raise ValueError("Invalid YouTube URL")
 
 
+async def _latest_job(db: AsyncSession, source_id: int) -> Optional[PipelineJob]:
+    return await db.scalar(
+        select(PipelineJob).filter(
+            PipelineJob.source_id == source_id
+        ).order_by(PipelineJob.id.desc()).limit(1)
+    )
+
+
 @router.post("/youtube", response_model=WebhookResponse)
 async def youtube_webhook(
     payload: YouTubeWebhookPayload,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Receive YouTube video URL and trigger ingestion workflow.
@@ -49,39 +66,68 @@ async def youtube_webhook(
     This endpoint:
     1. Validates the YouTube URL
     2. Checks if video already exists
-    3. Creates a new source_content record
-    4. Triggers the ingestion Celery task
+    3. Applies admission control: over the queue thresholds the video is
+       deferred (started later by release_deferred_pipelines) or rejected
+       with 429 and Retry-After, per ADMISSION_OVERLOAD_ACTION; if the
+       deferral can't be stored the pipeline is started right away
+    4. Creates a new source_content record and its pipeline_job
+    5. Starts the per-source Celery pipeline (job_id is the ingestion task)
     """
     try:
         video_url = str(payload.video_url)
         video_id = extract_video_id(video_url)
         
         # Check if video already exists
-        existing = db.query(SourceContent).filter(
-            SourceContent.video_id == video_id
-        ).first()
+        existing = await db.scalar(
+            select(SourceContent).filter(
+                SourceContent.video_id == video_id
+            )
+        )
         
         if existing:
             logger.info("video_already_exists", video_id=video_id)
+            job = await _latest_job(db, existing.id)
             return WebhookResponse(
-                job_id=str(existing.id),
+                job_id=job.task_id if job else None,
+                source_id=existing.id,
                 video_url=video_url,
                 status=existing.status.value,
                 message="Video already in system"
             )
         
-        # Create new source content record
+        decision = await admission_decision()
+        if decision == REJECT:
+            raise HTTPException(
+                status_code=429,
+                detail="Pipeline is at capacity, retry later",
+                headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER)}
+            )
+        
+        # Create the source and its job together, so the first stage
+        # transition always finds the job row
         source = SourceContent(
             video_url=video_url,
             video_id=video_id,
             status=ContentStatus.PENDING
         )
-        db.add(source)
-        db.commit()
-        db.refresh(source)
+        job = PipelineJob(source=source)
+        db.add_all([source, job])
+        await db.commit()
         
-        # Trigger async ingestion task
-        task = ingest_video.delay(source.id)
+        if decision == DEFER and await defer_pipeline_async(source.id):
+            logger.info("video_ingestion_deferred", video_id=video_id, source_id=source.id)
+            return WebhookResponse(
+                source_id=source.id,
+                video_url=video_url,
+                status="deferred",
+                message="System busy, video queued to start when capacity frees up"
+            )
+        
+        # Trigger the ingestion -> generation -> notification pipeline
+        task = start_pipeline(source.id)
+        
+        job.task_id = task.id
+        await db.commit()
         
         logger.info(
             "video_ingestion_started",
@@ -92,6 +138,7 @@ async def youtube_webhook(
         
         return WebhookResponse(
             job_id=task.id,
+            source_id=source.id,
             video_url=video_url,
             status="queued",
             message="Video queued for processing"
@@ -100,21 +147,88 @@ async def youtube_webhook(
     except ValueError as e:
         logger.error("invalid_youtube_url", error=str(e))
         raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("webhook_error", error=str(e))
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _task_status(job_id: str) -> dict:
+    """
+    Status of a Celery task or saved group from the result backend.
+    
+    The backend can't tell an unknown id from a queued task, so both
+    report "pending".
+    """
+    group_result = celery_app.GroupResult.restore(job_id)
+    if group_result is not None:
+        return {
+            "job_id": job_id,
+            "status": "completed" if group_result.ready() else "processing",
+            "completed": group_result.completed_count(),
+            "failed": sum(1 for result in group_result.results if result.failed()),
+            "total": len(group_result.results),
+        }
+    
+    result = celery_app.AsyncResult(job_id)
+    status = {"job_id": job_id, "status": result.state.lower()}
+    if result.successful():
+        status["result"] = result.result
+    elif result.failed():
+        status["error"] = str(result.result)
+    return status
+
+
 @router.get("/status/{job_id}")
-async def get_job_status(job_id: str):
-    """Get the status of an ingestion job"""
-    from celery.result import AsyncResult
-    from app.celery_app import celery_app
+async def get_job_status(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get the status of a job.
+    
+    Pipeline jobs (ingestion task ids) come from the pipeline_job table;
+    any other id, e.g. a publish_source task or a bulk publish group, is
+    looked up in the Celery result backend.
+    """
+    job = await db.scalar(
+        select(PipelineJob).filter(PipelineJob.task_id == job_id)
+    )
+    
+    if job is None:
+        # The result backend client is synchronous
+        return await asyncio.to_thread(_task_status, job_id)
+    
+    return serialize_job(job)
+
+
+@router.get("/pipeline/{source_id}")
+async def get_pipeline_status(source_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Get progress of every pipeline stage for a source"""
+    job = await _latest_job(db, source_id)
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail="No pipeline found for source")
+    
+    return serialize_job(job)
+
+
+@router.get("/pipeline/{source_id}/events")
+async def stream_pipeline_events(
+    source_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Server-sent events for a source's pipeline.
+    
+    Sends the current job first, then one `stage` event per transition
+    (ingestion, generation, notification, publishing) as the workers
+    record them.
+    """
+    pubsub = await subscribe(EVENTS_CHANNEL.format(source_id=source_id))
     
-    result = AsyncResult(job_id, app=celery_app)
+    job = await _latest_job(db, source_id)
+    if job is None:
+        await pubsub.reset()
+        raise HTTPException(status_code=404, detail="No pipeline found for source")
     
-    return {
-        "job_id": job_id,
-        "status": result.state,
-        "result": result.result if result.ready() else None,
-    }
+    return event_stream(request, pubsub, "stage", initial=[serialize_job(job)])
@@ -1,15 +1,20 @@
 from celery import Celery
+from celery.signals import before_task_publish
 from app.config import settings
+import time
 
 celery_app = Celery(
     "content_repurpose",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
     include=[
+        "app.workers.bootstrap",
+        "app.workers.task_metrics",
         "app.workers.ingestion",
         "app.workers.content_generation",
         "app.workers.publishing",
         "app.workers.notifications",
+        "app.workers.admission",
     ]
 )
 
@@ -24,7 +29,10 @@ celery_app.conf.update(
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
     worker_max_tasks_per_child=1000,
-    worker_prefetch_multiplier=settings.MAX_CONCURRENT_JOBS,
+    worker_prefetch_multiplier=settings.WORKER_PREFETCH_MULTIPLIER,
+    # Long tasks ack late (see the task decorators); unacked messages are
+    # redelivered after this, so it must exceed the time limit
+    broker_transport_options={"visibility_timeout": 2 * 60 * 60},
 )
 
 # Task routes
@@ -33,4 +41,36 @@ celery_app.conf.task_routes = {
     "app.workers.content_generation.*": {"queue": "generation"},
     "app.workers.publishing.*": {"queue": "publishing"},
     "app.workers.notifications.*": {"queue": "notifications"},
+    # Short tasks only there, so releases never wait behind ingestions
+    "app.workers.admission.*": {"queue": "notifications"},
+}
+
+# Task names, for enqueueing from the API without importing the worker
+# modules (and the SDKs they load)
+INGEST_VIDEO = "app.workers.ingestion.ingest_video"
+GENERATE_CONTENT = "app.workers.content_generation.generate_content"
+NOTIFY_CONTENT_READY = "app.workers.notifications.notify_content_ready"
+PUBLISH_CONTENT = "app.workers.publishing.publish_content"
+PUBLISH_SOURCE = "app.workers.publishing.publish_source"
+
+
+@before_task_publish.connect
+def stamp_enqueued_at(headers=None, **kwargs):
+    """Enqueue time, read by the worker for the queue wait histogram (app.workers.task_metrics)"""
+    if headers is not None:
+        headers["enqueued_at"] = time.time()
+
+
+# Periodic tasks (run with `celery -A app.celery_app beat`)
+celery_app.conf.beat_schedule = {
+    "dispatch-scheduled-content": {
+        "task": "app.workers.publishing.dispatch_scheduled_content",
+        "schedule": settings.PUBLISH_DISPATCH_INTERVAL,
+    },
+    "release-deferred-pipelines": {
+        "task": "app.workers.admission.release_deferred_pipelines",
+        "schedule": settings.ADMISSION_RELEASE_INTERVAL,
+        # Runs queued behind a slow one are superseded by the next tick
+        "options": {"expires": settings.ADMISSION_RELEASE_INTERVAL},
+    },
 }
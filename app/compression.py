@@ -0,0 +1,21 @@
+from brotli_asgi import BrotliMiddleware
+
+
+class CompressionMiddleware:
+    """
+    Brotli (gzip fallback, per Accept-Encoding) for responses of at least
+    `minimum_size` bytes.
+    
+    Server-sent event streams are passed through untouched: the compressor
+    buffers chunks, which would hold events back.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.compressed = BrotliMiddleware(app, minimum_size=minimum_size, gzip_fallback=True)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].endswith("/events"):
+            await self.app(scope, receive, send)
+            return
+        await self.compressed(scope, receive, send)
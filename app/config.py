@@ -5,6 +5,15 @@ from typing import Optional
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: Optional[str] = None  # defaults to DATABASE_URL with the asyncpg driver
+    
+    # Connection pool (per process - size for worker concurrency x pool size)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_PRE_PING: bool = True
+    DB_USE_PGBOUNCER: bool = False  # disable local pooling, let PgBouncer pool
     
     # Redis
     REDIS_URL: str
@@ -17,6 +26,13 @@ class Settings(BaseSettings):
     # AI/LLM
     OPENAI_API_KEY: str
     
+    # Outbound HTTP (publishers)
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_READ_TIMEOUT: float = 30.0
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_POOL_CONNECTIONS: int = 10
+    HTTP_POOL_MAXSIZE: int = 20
+    
     # Twitter/X
     TWITTER_API_KEY: Optional[str] = None
     TWITTER_API_SECRET: Optional[str] = None
@@ -32,23 +48,78 @@ class Settings(BaseSettings):
     # Instagram
     INSTAGRAM_ACCESS_TOKEN: Optional[str] = None
     INSTAGRAM_BUSINESS_ACCOUNT_ID: Optional[str] = None
+    INSTAGRAM_POLL_INITIAL_DELAY: int = 5  # seconds
+    INSTAGRAM_POLL_MAX_DELAY: int = 60
+    INSTAGRAM_POLL_MAX_ATTEMPTS: int = 20
     
     # Email
     EMAIL_PROVIDER: str = "resend"
     RESEND_API_KEY: Optional[str] = None
     SENDGRID_API_KEY: Optional[str] = None
     FROM_EMAIL: str = "newsletter@example.com"
+    NEWSLETTER_CHUNK_SIZE: Optional[int] = None  # defaults to the provider's recipient cap
+    NEWSLETTER_MAX_PARALLEL: int = 4
+    NEWSLETTER_CHUNK_RETRIES: int = 3
     
     # Feature Flags
     ENABLE_AUTO_PUBLISH: bool = False
     ENABLE_EMAIL_NOTIFICATIONS: bool = True
-    MAX_CONCURRENT_JOBS: int = 3
+    NOTIFICATION_DIGEST_ENABLED: bool = False
+    NOTIFICATION_DIGEST_WINDOW: int = 300  # seconds
+    
+    # Workers
+    WORKER_PREFETCH_MULTIPLIER: int = 1  # reserve one task per slot; long tasks shouldn't queue behind each other
+    PUBLISH_SOURCE_MAX_PARALLEL: int = 8  # per process, across all publish_source runs (one DB session each)
+    
+    # Metrics
+    WORKER_METRICS_PORT: Optional[int] = None
+    QUEUE_EXPORTER_PORT: int = 9809
+    QUEUE_EXPORTER_INTERVAL: int = 15  # seconds between queue samples
+    
+    # Scaling signal: workers needed so queued work starts within the target wait
+    QUEUE_TARGET_WAIT: int = 60  # seconds
+    QUEUE_MAX_WORKERS: int = 10  # per queue
+    
+    # Admission control on the YouTube webhook
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_BACKLOG: int = 100  # tasks waiting on the ingestion + generation queues
+    ADMISSION_MAX_GENERATING: int = 64  # generation tasks running
+    ADMISSION_OVERLOAD_ACTION: str = "defer"  # "defer" (start later) or "reject" (429)
+    ADMISSION_MAX_DEFERRED: int = 1000  # beyond this, deferring also rejects
+    ADMISSION_RETRY_AFTER: int = 60  # seconds, Retry-After of a 429
+    ADMISSION_RELEASE_INTERVAL: int = 30  # seconds between deferred release runs
+    ADMISSION_RELEASE_BATCH: int = 20
+    
+    # Scheduled publishing
+    SCHEDULED_PUBLISHING_ENABLED: bool = True
+    PUBLISH_DISPATCH_INTERVAL: int = 30  # seconds between scheduler runs
+    PUBLISH_DISPATCH_BATCH: int = 20
+    PUBLISH_WINDOW_START_HOUR: int = 0  # UTC; equal start and end means all day
+    PUBLISH_WINDOW_END_HOUR: int = 0
+    PUBLISH_SLOT_INTERVAL_TWITTER: int = 300  # seconds between publishes per platform
+    PUBLISH_SLOT_INTERVAL_LINKEDIN: int = 600
+    PUBLISH_SLOT_INTERVAL_INSTAGRAM: int = 600
+    PUBLISH_SLOT_INTERVAL_NEWSLETTER: int = 3600
+    
+    # Dashboard
+    DASHBOARD_STATS_TTL: int = 10  # seconds
+    
+    # Content detail cache (entries are also invalidated on every change)
+    CONTENT_CACHE_TTL: int = 3600  # seconds
+    
+    # Response compression (brotli, gzip fallback)
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes
+    
+    # Server-sent events
+    SSE_KEEPALIVE_INTERVAL: int = 15  # seconds between comment pings
     
     # Frontend
     FRONTEND_URL: str = "http://localhost:5173"
     
     class Config:
         env_file = ".env"
+        # Retired settings left in existing .env files don't fail startup
+        extra = "ignore"
 
 
 settings = Settings()
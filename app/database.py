@@ -1,11 +1,113 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool, NullPool
 from app.config import settings
+from app.metrics import DB_POOL_CHECKOUT_SECONDS, DB_POOL_CHECKED_OUT, DB_POOL_SATURATION
+import time
 
-engine = create_engine(settings.DATABASE_URL)
+
+def _async_database_url(url: str) -> str:
+    """Derive the asyncpg URL from the sync DATABASE_URL"""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+class _TimedCheckoutMixin:
+    """Records how long callers wait for a pooled connection"""
+    metrics_label = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self.metrics_label).observe(
+                time.perf_counter() - start
+            )
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _instrument_pool(engine, label: str):
+    """Track checked-out connections and saturation for an engine's pool"""
+    pool = engine.pool
+    pool.metrics_label = label
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+
+    def _report():
+        checked_out = pool.checkedout()
+        DB_POOL_CHECKED_OUT.labels(label).set(checked_out)
+        DB_POOL_SATURATION.labels(label).set(checked_out / capacity if capacity else 0)
+
+    event.listen(pool, "checkout", lambda *args: _report())
+    event.listen(pool, "checkin", lambda *args: _report())
+
+
+def engine_options(async_: bool = False) -> dict:
+    """
+    Pool settings shared by every engine.
+    
+    With DB_USE_PGBOUNCER the local pool is disabled and PgBouncer (transaction
+    mode) does the pooling, so prepared statement caches must be turned off too.
+    """
+    if settings.DB_USE_PGBOUNCER:
+        options = {"poolclass": NullPool}
+        if async_:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            }
+        return options
+    
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if async_ else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def build_engine(label: str = "sync"):
+    """Create a sync engine with the configured pool (one per process)"""
+    engine = create_engine(settings.DATABASE_URL, **engine_options())
+    if not settings.DB_USE_PGBOUNCER:
+        _instrument_pool(engine, label)
+    return engine
+
+
+# Sync engine - used by Celery workers and the LangGraph nodes.
+# Workers rebind SessionLocal to a fresh engine after fork (see app.workers.db).
+engine = build_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine - used by the FastAPI routes so queries don't block the event loop
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    **engine_options(async_=True)
+)
+if not settings.DB_USE_PGBOUNCER:
+    _instrument_pool(async_engine.sync_engine, "async")
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
@@ -16,3 +118,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Async database dependency for FastAPI"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,7 +1,10 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.api import webhooks, approval, dashboard
+from app.compression import CompressionMiddleware
+from app.metrics import render_latest
+from prometheus_client import CONTENT_TYPE_LATEST
 import structlog
 
 # Configure structured logging
@@ -29,6 +32,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Brotli/gzip for large payloads (newsletter and LinkedIn bodies, lists)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
 # Include routers
 app.include_router(webhooks.router, prefix="/webhook", tags=["webhooks"])
 app.include_router(approval.router, prefix="/api/content", tags=["content"])
@@ -49,6 +55,11 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics():
+    return Response(content=render_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("application_started", port=settings.PORT)
@@ -0,0 +1,110 @@
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    start_http_server,
+)
+from prometheus_client import multiprocess
+import os
+import structlog
+
+logger = structlog.get_logger()
+
+
+# Database connection pool
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SATURATION = Gauge(
+    "db_pool_saturation_ratio",
+    "Checked out connections divided by pool_size + max_overflow",
+    ["engine"],
+    multiprocess_mode="livemax",
+)
+
+
+# Celery tasks (observed in the worker that runs the task)
+TASK_QUEUE_WAIT_SECONDS = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Time between enqueue (or ETA) and the start of the task",
+    ["queue", "task"],
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+
+TASK_RUN_SECONDS = Histogram(
+    "celery_task_run_seconds",
+    "Task run time",
+    ["queue", "task", "state"],
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800),
+)
+
+
+# Queues (set by the queue exporter, app/queue_exporter.py)
+QUEUE_DEPTH = Gauge(
+    "celery_queue_depth",
+    "Messages waiting in the queue",
+    ["queue"],
+    multiprocess_mode="livemax",
+)
+
+QUEUE_RUNNING = Gauge(
+    "celery_queue_running_tasks",
+    "Tasks of the queue currently running on a worker",
+    ["queue"],
+    multiprocess_mode="livemax",
+)
+
+QUEUE_DESIRED_WORKERS = Gauge(
+    "celery_queue_desired_workers",
+    "Workers needed for queued work to start within QUEUE_TARGET_WAIT",
+    ["queue"],
+    multiprocess_mode="livemax",
+)
+
+
+# Admission control on the YouTube webhook
+ADMISSION_DECISIONS = Counter(
+    "webhook_admission_decisions_total",
+    "YouTube webhook requests by admission decision (admit, defer, reject)",
+    ["decision"],
+)
+
+
+def _registry():
+    """Collect from every process when running under prefork workers"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    from prometheus_client import REGISTRY
+    return REGISTRY
+
+
+def render_latest() -> bytes:
+    """Render all metrics in the Prometheus text format"""
+    return generate_latest(_registry())
+
+
+def start_metrics_server(port: int):
+    """Expose /metrics on a side port (used by the Celery main process)"""
+    start_http_server(port, registry=_registry())
+    logger.info("metrics_server_started", port=port)
+
+
+def mark_process_dead(pid: int):
+    """Drop live gauges of an exited prefork child"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -1,6 +1,8 @@
 from app.models.source_content import SourceContent, ContentStatus
 from app.models.generated_content import GeneratedContent, Platform, ApprovalStatus
 from app.models.style_guide import StyleGuide
+from app.models.publish_ledger import PublishLedgerEntry
+from app.models.pipeline_job import PipelineJob, PipelineStage
 
 __all__ = [
     "SourceContent",
@@ -9,4 +11,7 @@ __all__ = [
     "Platform",
     "ApprovalStatus",
     "StyleGuide",
+    "PublishLedgerEntry",
+    "PipelineJob",
+    "PipelineStage",
 ]
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, ForeignKey, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -22,6 +23,29 @@ class ApprovalStatus(str, enum.Enum):
 
 class GeneratedContent(Base):
     __tablename__ = "generated_content"
+    __table_args__ = (
+        # Keyset pagination on (created_at, id), newest first
+        Index("ix_generated_content_created_at_id", "created_at", "id"),
+        # Approval queue: pending rows only, newest first
+        Index(
+            "ix_generated_content_pending_created_at_id", "created_at", "id",
+            postgresql_where=text("approval_status = 'PENDING_APPROVAL'")
+        ),
+        # Dashboard GROUP BY and status filters ordered by recency
+        Index("ix_generated_content_approval_status_created_at", "approval_status", "created_at"),
+        # publish_source: approved items of one source
+        Index("ix_generated_content_source_id_approval_status", "source_id", "approval_status"),
+        # Scheduler: due approved rows not yet handed to a publish task
+        Index(
+            "ix_generated_content_due_publish_at", "publish_at",
+            postgresql_where=text("approval_status = 'APPROVED' AND publish_at IS NOT NULL AND dispatched_at IS NULL")
+        ),
+        # Last slot per platform, over scheduled and already published rows
+        Index(
+            "ix_generated_content_platform_last_slot", "platform", text("greatest(publish_at, published_at)"),
+            postgresql_where=text("approval_status IN ('APPROVED', 'PUBLISHED')")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     source_id = Column(Integer, ForeignKey("source_content.id"), nullable=False, index=True)
@@ -36,12 +60,17 @@ class GeneratedContent(Base):
     # Media attachments
     media_urls = Column(Text, nullable=True)  # JSON array
     
+    # Platform extras, e.g. the newsletter subject line
+    metadata_ = Column("metadata", JSONB, nullable=True)
+    
     # Approval workflow
     approval_status = Column(SQLEnum(ApprovalStatus), default=ApprovalStatus.PENDING_APPROVAL, nullable=False)
     approved_by = Column(String, nullable=True)
     approved_at = Column(DateTime(timezone=True), nullable=True)
     
     # Publishing
+    publish_at = Column(DateTime(timezone=True), nullable=True)  # scheduled slot, kept after dispatch
+    dispatched_at = Column(DateTime(timezone=True), nullable=True)  # handed to a publish task
     published_url = Column(String, nullable=True)
     published_at = Column(DateTime(timezone=True), nullable=True)
     
@@ -52,3 +81,6 @@ class GeneratedContent(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Relationships
+    source = relationship("SourceContent", back_populates="generated_content")
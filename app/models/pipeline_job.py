@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+import enum
+from app.database import Base
+from app.models.source_content import ContentStatus
+
+
+class PipelineStage(str, enum.Enum):
+    QUEUED = "queued"
+    INGESTION = "ingestion"
+    GENERATION = "generation"
+    NOTIFICATION = "notification"
+    PUBLISHING = "publishing"
+
+
+class PipelineJob(Base):
+    """
+    Progress of one source through the pipeline, updated by the workers at
+    every stage transition and pushed to subscribers (see
+    app.services.pipeline_jobs).
+    """
+    __tablename__ = "pipeline_job"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source_id = Column(Integer, ForeignKey("source_content.id"), nullable=False, index=True)
+    
+    # Root (ingestion) task of the Celery chain
+    task_id = Column(String, unique=True, nullable=True, index=True)
+    
+    # Current stage and its status
+    stage = Column(SQLEnum(PipelineStage), default=PipelineStage.QUEUED, nullable=False)
+    status = Column(SQLEnum(ContentStatus), default=ContentStatus.PENDING, nullable=False)
+    error_message = Column(Text, nullable=True)
+    
+    # Last transition of every stage reached so far, keyed by stage name
+    stages = Column(JSONB, nullable=False, default=dict)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Relationships
+    source = relationship("SourceContent")
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class PublishLedgerEntry(Base):
+    """
+    One external side effect of publishing (a tweet, an Instagram container,
+    a post id, a newsletter chunk), recorded as soon as it succeeds so that
+    retries resume from the first unfinished step.
+    """
+    __tablename__ = "publish_ledger"
+    __table_args__ = (
+        UniqueConstraint("content_id", "step", name="uq_publish_ledger_content_step"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    content_id = Column(Integer, ForeignKey("generated_content.id"), nullable=False, index=True)
+    platform = Column(String, nullable=False)
+    
+    # Step name, e.g. "tweet:3", "container", "publish", "chunk:0"
+    step = Column(String, nullable=False)
+    external_id = Column(String, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,5 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
 from pgvector.sqlalchemy import Vector
 import enum
 from app.database import Base
@@ -14,6 +16,13 @@ class ContentStatus(str, enum.Enum):
 
 class SourceContent(Base):
     __tablename__ = "source_content"
+    __table_args__ = (
+        # Keyset pagination on (created_at, id), newest first
+        Index("ix_source_content_created_at_id", "created_at", "id"),
+        # Status filters ordered by recency; also covers GROUP BY status
+        Index("ix_source_content_status_created_at", "status", "created_at"),
+        Index("ix_source_content_metadata", "metadata", postgresql_using="gin"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     video_url = Column(String, unique=True, nullable=False, index=True)
@@ -29,8 +38,8 @@ class SourceContent(Base):
     # Embeddings for semantic search
     embedding = Column(Vector(1536), nullable=True)
     
-    # Metadata
-    metadata = Column(JSON, nullable=True)
+    # Metadata ("metadata" is reserved on declarative models, hence the attribute name)
+    metadata_ = Column("metadata", JSONB, nullable=True)
     
     # Status tracking
     status = Column(SQLEnum(ContentStatus), default=ContentStatus.PENDING, nullable=False)
@@ -40,3 +49,6 @@ class SourceContent(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     processed_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Relationships
+    generated_content = relationship("GeneratedContent", back_populates="source")
@@ -0,0 +1,69 @@
+"""
+Queue exporter for Prometheus and worker autoscaling.
+
+Samples every queue's depth, running tasks and recent run times from Redis
+and exposes them, with a desired worker count per queue, on
+QUEUE_EXPORTER_PORT. Wait and run time histograms are exported by the
+workers themselves (WORKER_METRICS_PORT).
+
+Run with `python -m app.queue_exporter`.
+"""
+from app.celery_app import celery_app
+from app.config import settings
+from app.metrics import QUEUE_DEPTH, QUEUE_RUNNING, QUEUE_DESIRED_WORKERS, start_metrics_server
+from app.services.queue_stats import QUEUES, queue_snapshot
+import math
+import time
+import structlog
+
+logger = structlog.get_logger()
+
+# Task slots per worker (--concurrency of each service in docker-compose.yml)
+WORKER_SLOTS = {
+    "ingestion": 2,
+    "generation": 16,
+    "publishing": 32,
+    "notifications": 16,
+}
+
+
+def desired_workers(queue: str, depth: int, running: int, mean_runtime: float) -> int:
+    """
+    Workers needed to keep current work busy and start queued work within
+    QUEUE_TARGET_WAIT.
+
+    Outstanding work is (queued + running) tasks times the mean recent run
+    time; spread over the target wait it gives the slots to provision.
+    Without run time samples each task is assumed to take the target wait.
+    Clamped to 1..QUEUE_MAX_WORKERS.
+    """
+    runtime = mean_runtime or settings.QUEUE_TARGET_WAIT
+    slots = max(running, (depth + running) * runtime / settings.QUEUE_TARGET_WAIT)
+    workers = math.ceil(slots / WORKER_SLOTS[queue])
+    return min(max(workers, 1), settings.QUEUE_MAX_WORKERS)
+
+
+def sample() -> None:
+    """Refresh the queue gauges"""
+    for queue in QUEUES:
+        snapshot = queue_snapshot(queue, stale_after=celery_app.conf.task_time_limit)
+        desired = desired_workers(queue, snapshot["depth"], snapshot["running"], snapshot["mean_runtime"])
+
+        QUEUE_DEPTH.labels(queue).set(snapshot["depth"])
+        QUEUE_RUNNING.labels(queue).set(snapshot["running"])
+        QUEUE_DESIRED_WORKERS.labels(queue).set(desired)
+
+
+def main() -> None:
+    start_metrics_server(settings.QUEUE_EXPORTER_PORT)
+
+    while True:
+        try:
+            sample()
+        except Exception as e:
+            logger.warning("queue_sample_failed", error=str(e))
+        time.sleep(settings.QUEUE_EXPORTER_INTERVAL)
+
+
+if __name__ == "__main__":
+    main()
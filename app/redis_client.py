@@ -0,0 +1,22 @@
+import redis
+import redis.asyncio
+from app.config import settings
+
+_client = None
+_async_client = None
+
+
+def get_redis() -> redis.Redis:
+    """Shared Redis client (connection pool is created lazily per process)"""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
+
+
+def get_async_redis() -> redis.asyncio.Redis:
+    """Shared asyncio Redis client for the API process"""
+    global _async_client
+    if _async_client is None:
+        _async_client = redis.asyncio.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _async_client
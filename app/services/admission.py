@@ -0,0 +1,124 @@
+from app.celery_app import celery_app
+from app.config import settings
+from app.metrics import ADMISSION_DECISIONS
+from app.redis_client import get_redis, get_async_redis
+from app.services.queue_stats import RUNNING_KEY, queue_snapshot
+import structlog
+import time
+
+logger = structlog.get_logger()
+
+ADMIT = "admit"
+DEFER = "defer"
+REJECT = "reject"
+
+# Sources whose pipeline waits for headroom, scored by deferral time (oldest first)
+DEFERRED_KEY = "pipeline:deferred"
+
+# Held by the running release_deferred_pipelines, so runs never overlap
+RELEASE_LOCK_KEY = "pipeline:deferred:release"
+
+
+def _headroom(backlog: int, generating: int) -> int:
+    """How many more pipelines fit under both thresholds"""
+    return min(
+        settings.ADMISSION_MAX_BACKLOG - backlog,
+        settings.ADMISSION_MAX_GENERATING - generating
+    )
+
+
+async def admission_decision() -> str:
+    """
+    Whether a new pipeline may start now.
+
+    Load is the number of tasks waiting on the ingestion and generation
+    queues and the number of generation tasks running. Once deferred
+    pipelines exist new ones queue behind them, so order is kept. Over the
+    thresholds the request is deferred or rejected per
+    ADMISSION_OVERLOAD_ACTION; a full deferred queue always rejects. If
+    Redis can't be read the request is admitted.
+    """
+    if not settings.ADMISSION_CONTROL_ENABLED:
+        return ADMIT
+
+    try:
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            pipe.llen("ingestion")
+            pipe.llen("generation")
+            pipe.hvals(RUNNING_KEY.format(queue="generation"))
+            pipe.zcard(DEFERRED_KEY)
+            ingestion, generation, started, deferred = await pipe.execute()
+    except Exception as e:
+        logger.warning("admission_check_failed", error=str(e))
+        return ADMIT
+
+    # Entries older than the time limit belong to workers that died mid-task
+    cutoff = time.time() - celery_app.conf.task_time_limit
+    generating = sum(1 for value in started if float(value) >= cutoff)
+
+    if deferred == 0 and _headroom(ingestion + generation, generating) > 0:
+        decision = ADMIT
+    elif settings.ADMISSION_OVERLOAD_ACTION == DEFER and deferred < settings.ADMISSION_MAX_DEFERRED:
+        decision = DEFER
+    else:
+        decision = REJECT
+
+    if decision != ADMIT:
+        logger.info(
+            "admission_over_limit",
+            decision=decision,
+            backlog=ingestion + generation,
+            generating=generating,
+            deferred=deferred
+        )
+    ADMISSION_DECISIONS.labels(decision).inc()
+
+    return decision
+
+
+async def defer_pipeline_async(source_id: int) -> bool:
+    """
+    Queue a source's pipeline until release_deferred_pipelines starts it.
+
+    Returns False if Redis can't be written; the caller then starts the
+    pipeline itself, in line with admitting when the load can't be read.
+    """
+    try:
+        await get_async_redis().zadd(DEFERRED_KEY, {source_id: time.time()}, nx=True)
+    except Exception as e:
+        logger.warning("pipeline_defer_failed", source_id=source_id, error=str(e))
+        return False
+    return True
+
+
+def defer_pipeline(source_id: int, deferred_at: float) -> None:
+    """Put a source in the deferred queue at the given position (no-op if already queued)"""
+    get_redis().zadd(DEFERRED_KEY, {source_id: deferred_at}, nx=True)
+
+
+def deferred_sources(source_ids: list) -> set:
+    """Which of the given sources are already in the deferred queue"""
+    if not source_ids:
+        return set()
+    scores = get_redis().zmscore(DEFERRED_KEY, source_ids)
+    return {source_id for source_id, score in zip(source_ids, scores) if score is not None}
+
+
+def pop_deferred() -> list:
+    """
+    Claim the oldest deferred sources that fit under the thresholds.
+
+    Returns (source_id, deferred_at) pairs; ZPOPMIN is atomic, so
+    overlapping release runs never claim the same source.
+    """
+    ingestion = get_redis().llen("ingestion")
+    generation = queue_snapshot("generation", stale_after=celery_app.conf.task_time_limit)
+
+    count = min(
+        _headroom(ingestion + generation["depth"], generation["running"]),
+        settings.ADMISSION_RELEASE_BATCH
+    )
+    if count <= 0:
+        return []
+
+    return [(int(member), score) for member, score in get_redis().zpopmin(DEFERRED_KEY, count)]
@@ -0,0 +1,57 @@
+from app.redis_client import get_redis, get_async_redis
+from app.config import settings
+import structlog
+import hashlib
+
+logger = structlog.get_logger()
+
+CONTENT_CACHE_KEY = "content:{content_id}"
+
+
+def content_etag(body: str) -> str:
+    """Strong ETag for a serialized ContentResponse"""
+    return '"' + hashlib.sha256(body.encode()).hexdigest()[:32] + '"'
+
+
+async def get_cached_content(content_id: int) -> str:
+    """Serialized ContentResponse, or None on a miss or when Redis is unavailable"""
+    try:
+        return await get_async_redis().get(CONTENT_CACHE_KEY.format(content_id=content_id))
+    except Exception as e:
+        logger.warning("content_cache_unavailable", content_id=content_id, error=str(e))
+        return None
+
+
+async def cache_content(content_id: int, body: str) -> None:
+    """
+    Store a serialized ContentResponse.
+
+    Writers delete the entry after committing; the TTL bounds how long a
+    fill racing with such a write can serve the older version.
+    """
+    try:
+        await get_async_redis().set(
+            CONTENT_CACHE_KEY.format(content_id=content_id), body, ex=settings.CONTENT_CACHE_TTL
+        )
+    except Exception as e:
+        logger.warning("content_cache_unavailable", content_id=content_id, error=str(e))
+
+
+def invalidate_content(content_ids: list) -> None:
+    """Drop cached responses after a worker commits a change"""
+    if not content_ids:
+        return
+    try:
+        get_redis().delete(*(CONTENT_CACHE_KEY.format(content_id=i) for i in content_ids))
+    except Exception as e:
+        logger.warning("content_cache_invalidation_failed", count=len(content_ids), error=str(e))
+
+
+async def invalidate_content_async(content_ids: list) -> None:
+    """Drop cached responses after the API commits a change"""
+    if not content_ids:
+        return
+    try:
+        await get_async_redis().delete(*(CONTENT_CACHE_KEY.format(content_id=i) for i in content_ids))
+    except Exception as e:
+        logger.warning("content_cache_invalidation_failed", count=len(content_ids), error=str(e))
@@ -0,0 +1,87 @@
+from app.models import GeneratedContent, ApprovalStatus
+from app.redis_client import get_redis, get_async_redis
+import structlog
+import json
+
+logger = structlog.get_logger()
+
+EVENTS_CHANNEL = "content:events"
+
+# Same length as the pending list preview
+PREVIEW_LENGTH = 280
+
+
+def content_event(
+    event_type: str,
+    content: GeneratedContent,
+    previous_status: str = None,
+    video_title: str = None,
+    video_url: str = None
+) -> dict:
+    """
+    Change event for one content item.
+
+    event_type is "created", "updated" or "status_changed"; the item has
+    the shape of a pending list entry so the UI can insert or patch it
+    directly, and previous_status lets counters be moved without a reload.
+    """
+    return {
+        "type": event_type,
+        "previous_status": previous_status,
+        "item": _item(
+            content,
+            (content.content or "")[:PREVIEW_LENGTH],
+            content.approval_status,
+            video_title,
+            video_url
+        ),
+    }
+
+
+def status_changed_event(row, approval_status: ApprovalStatus) -> dict:
+    """
+    Change event for a row selected as columns (id, source_id, platform,
+    approval_status, created_at, preview) whose status was then changed by
+    a set-based UPDATE.
+    """
+    return {
+        "type": "status_changed",
+        "previous_status": row.approval_status.value,
+        "item": _item(row, row.preview or "", approval_status),
+    }
+
+
+def _item(content, preview: str, approval_status: ApprovalStatus, video_title: str = None, video_url: str = None) -> dict:
+    """Pending list entry shape"""
+    return {
+        "id": content.id,
+        "source_id": content.source_id,
+        "platform": content.platform.value,
+        "preview": preview,
+        "approval_status": approval_status.value,
+        "created_at": content.created_at.isoformat() if content.created_at else None,
+        "video_title": video_title,
+        "video_url": video_url,
+    }
+
+
+def publish_content_events(events: list) -> None:
+    """Publish change events from a worker (after the change is committed)"""
+    try:
+        with get_redis().pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.publish(EVENTS_CHANNEL, json.dumps(event))
+            pipe.execute()
+    except Exception as e:
+        logger.warning("content_event_publish_failed", count=len(events), error=str(e))
+
+
+async def publish_content_events_async(events: list) -> None:
+    """Publish change events from the API (after the change is committed)"""
+    try:
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.publish(EVENTS_CHANNEL, json.dumps(event))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("content_event_publish_failed", count=len(events), error=str(e))
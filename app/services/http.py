@@ -0,0 +1,71 @@
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.config import settings
+import os
+import requests
+
+_session = None
+_session_pid = None
+
+
+class PooledSession(requests.Session):
+    """requests.Session that applies a default timeout to every call"""
+    
+    def __init__(self, timeout):
+        super().__init__()
+        self.default_timeout = timeout
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+def _build_session() -> PooledSession:
+    # Status retries only for idempotent methods so a POST is never re-sent
+    # after the platform accepted it; connection errors are safe to retry.
+    retry = Retry(
+        total=settings.HTTP_MAX_RETRIES,
+        connect=settings.HTTP_MAX_RETRIES,
+        read=0,
+        status=settings.HTTP_MAX_RETRIES,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    
+    session = PooledSession(
+        timeout=(settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session() -> PooledSession:
+    """
+    Shared keep-alive session for all publishers.
+    
+    Built lazily once per process, so prefork children never share sockets
+    with their parent.
+    """
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        _session = _build_session()
+        _session_pid = os.getpid()
+    return _session
+
+
+def close_http_session() -> None:
+    """Close this process's pooled connections (worker process shutdown)"""
+    global _session, _session_pid
+    if _session is not None and _session_pid == os.getpid():
+        _session.close()
+    _session = None
+    _session_pid = None
@@ -0,0 +1,74 @@
+from app.models import PipelineJob, PipelineStage, ContentStatus
+from app.redis_client import get_redis
+from datetime import datetime, timezone
+import structlog
+import json
+
+logger = structlog.get_logger()
+
+EVENTS_CHANNEL = "pipeline:events:{source_id}"
+
+
+def serialize_job(job: PipelineJob) -> dict:
+    """JSON-ready view of a job, as returned by the API and pushed to subscribers"""
+    return {
+        "job_id": job.task_id,
+        "source_id": job.source_id,
+        "stage": job.stage.value,
+        "status": job.status.value,
+        "error": job.error_message,
+        "stages": job.stages or {},
+    }
+
+
+def record_stage(
+    db,
+    source_id: int,
+    stage: PipelineStage,
+    status: ContentStatus,
+    error: str = None
+) -> PipelineJob:
+    """
+    Move the source's latest job to a stage/status, commit, and push the
+    change to subscribers.
+
+    The row is locked so concurrent publishers of the same source don't
+    overwrite each other's stage history. Returns None for sources created
+    before job tracking existed.
+    """
+    job = db.query(PipelineJob).filter(
+        PipelineJob.source_id == source_id
+    ).order_by(PipelineJob.id.desc()).with_for_update().first()
+
+    if job is None:
+        db.rollback()
+        return None
+
+    job.stage = stage
+    job.status = status
+    job.error_message = error
+    # Reassign so the JSONB column is flagged as changed
+    job.stages = {
+        **(job.stages or {}),
+        stage.value: {
+            "status": status.value,
+            "error": error,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        },
+    }
+    db.commit()
+
+    publish_job_event(job)
+
+    return job
+
+
+def publish_job_event(job: PipelineJob) -> None:
+    """Push a job snapshot to the source's channel; the DB row stays authoritative"""
+    try:
+        get_redis().publish(
+            EVENTS_CHANNEL.format(source_id=job.source_id),
+            json.dumps(serialize_job(job))
+        )
+    except Exception as e:
+        logger.warning("pipeline_event_publish_failed", source_id=job.source_id, error=str(e))
@@ -0,0 +1,65 @@
+from sqlalchemy.orm import Session
+from app.models import PublishLedgerEntry
+import structlog
+
+logger = structlog.get_logger()
+
+
+class PublishLedger:
+    """
+    Per-content view of the publish ledger handed to publishers.
+    
+    Publishers call get(step) before a side effect and record(step, id)
+    right after it succeeds; each record is committed immediately.
+    """
+    
+    def __init__(self, db: Session, content_id: int, platform: str):
+        self.db = db
+        self.content_id = content_id
+        self.platform = platform
+        
+        entries = db.query(PublishLedgerEntry).filter(
+            PublishLedgerEntry.content_id == content_id
+        ).all()
+        self._steps = {entry.step: entry.external_id for entry in entries}
+    
+    def get(self, step: str):
+        """External id recorded for a step, or None if it hasn't happened"""
+        return self._steps.get(step)
+    
+    def has(self, step: str) -> bool:
+        return step in self._steps
+    
+    def record(self, step: str, external_id=None):
+        """Persist a completed side effect"""
+        if step in self._steps:
+            return
+        
+        self.db.add(PublishLedgerEntry(
+            content_id=self.content_id,
+            platform=self.platform,
+            step=step,
+            external_id=str(external_id) if external_id is not None else None
+        ))
+        self.db.commit()
+        self._steps[step] = external_id
+        
+        logger.info(
+            "publish_step_recorded",
+            content_id=self.content_id,
+            step=step,
+            external_id=external_id
+        )
+    
+    def discard(self, step: str):
+        """Forget a step whose external object became unusable"""
+        self.db.query(PublishLedgerEntry).filter(
+            PublishLedgerEntry.content_id == self.content_id,
+            PublishLedgerEntry.step == step
+        ).delete()
+        self.db.commit()
+        self._steps.pop(step, None)
+    
+    @property
+    def completed_steps(self) -> int:
+        return len(self._steps)
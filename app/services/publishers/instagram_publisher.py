@@ -1,37 +1,89 @@
-import requests
 from app.config import settings
+from app.services.http import get_http_session
 import structlog
 
 logger = structlog.get_logger()
 
+# Instagram business account id per access token
+_business_account_cache = {}
+
 
 class InstagramPublisher:
     """Publisher for Instagram using Graph API"""
     
     def __init__(self):
         self.access_token = settings.INSTAGRAM_ACCESS_TOKEN
-        self.business_account_id = settings.INSTAGRAM_BUSINESS_ACCOUNT_ID
+        self._business_account_id = settings.INSTAGRAM_BUSINESS_ACCOUNT_ID
         self.base_url = "https://graph.facebook.com/v18.0"
     
-    def publish_post(self, caption: str, image_url: str = None) -> dict:
+    @property
+    def business_account_id(self) -> str:
+        """
+        Configured business account id, or the one linked to the token's
+        Facebook page (looked up once per access token).
+        """
+        if self._business_account_id:
+            return self._business_account_id
+        
+        cached = _business_account_cache.get(self.access_token)
+        if cached:
+            return cached
+        
+        response = get_http_session().get(
+            f"{self.base_url}/me/accounts",
+            params={
+                "fields": "instagram_business_account",
+                "access_token": self.access_token
+            }
+        )
+        response.raise_for_status()
+        
+        for page in response.json().get("data", []):
+            account = page.get("instagram_business_account")
+            if account:
+                _business_account_cache[self.access_token] = account["id"]
+                logger.info("instagram_business_account_cached", account_id=account["id"])
+                return account["id"]
+        
+        raise ValueError("No Instagram business account linked to the access token")
+    
+    def publish_post(self, caption: str, image_url: str = None, ledger=None) -> dict:
         """
-        Publish an Instagram post.
+        Publish an Instagram post in one call.
         
         Note: Instagram requires a 2-step process:
         1. Create media container
         2. Publish container
         
+        Publishing only succeeds once the container is FINISHED, so workers
+        use create_container / get_container_status / publish_container and
+        poll in between instead of calling this.
+        
         Args:
             caption: Post caption
             image_url: URL to publicly accessible image
+            ledger: Optional PublishLedger; a container or post recorded by an
+                earlier attempt is reused instead of created again
         
         Returns:
             dict with post_id and url
         """
+        container_id = self.create_container(caption, image_url, ledger=ledger)
+        return self.publish_container(container_id, ledger=ledger)
+    
+    def create_container(self, caption: str, image_url: str = None, ledger=None) -> str:
+        """
+        Step 1: Create media container (or reuse the one in the ledger).
+        
+        Returns:
+            container id
+        """
         try:
-            logger.info("publishing_instagram_post")
+            container_id = ledger.get("container") if ledger else None
+            if container_id:
+                logger.info("instagram_container_reused", container_id=container_id)
+                return container_id
             
-            # Step 1: Create media container
             container_params = {
                 "caption": caption,
                 "access_token": self.access_token
@@ -43,38 +95,82 @@ class InstagramPublisher:
                 # For text-only (not typical for Instagram), you'd need a default image
                 logger.warning("instagram_post_without_image")
             
-            container_response = requests.post(
+            container_response = get_http_session().post(
                 f"{self.base_url}/{self.business_account_id}/media",
                 params=container_params
             )
             container_response.raise_for_status()
             container_id = container_response.json()["id"]
+            if ledger:
+                ledger.record("container", container_id)
             
             logger.info("instagram_container_created", container_id=container_id)
             
-            # Step 2: Publish the container
+            return container_id
+            
+        except Exception as e:
+            logger.error("instagram_container_failed", error=str(e))
+            raise
+    
+    def get_container_status(self, container_id: str) -> str:
+        """
+        Processing state of a container.
+        
+        Returns:
+            One of FINISHED, IN_PROGRESS, ERROR, EXPIRED, PUBLISHED
+        """
+        response = get_http_session().get(
+            f"{self.base_url}/{container_id}",
+            params={
+                "fields": "status_code",
+                "access_token": self.access_token
+            }
+        )
+        response.raise_for_status()
+        return response.json().get("status_code", "IN_PROGRESS")
+    
+    def publish_container(self, container_id: str, ledger=None) -> dict:
+        """
+        Step 2: Publish a FINISHED container.
+        
+        Returns:
+            dict with post_id and url
+        """
+        try:
+            logger.info("publishing_instagram_post", container_id=container_id)
+            
+            post_id = ledger.get("publish") if ledger else None
+            if post_id:
+                logger.info("instagram_post_already_published", post_id=post_id)
+                return self._result(post_id)
+            
             publish_params = {
                 "creation_id": container_id,
                 "access_token": self.access_token
             }
             
-            publish_response = requests.post(
+            publish_response = get_http_session().post(
                 f"{self.base_url}/{self.business_account_id}/media_publish",
                 params=publish_params
             )
             publish_response.raise_for_status()
             post_id = publish_response.json()["id"]
+            if ledger:
+                ledger.record("publish", post_id)
             
-            post_url = f"https://www.instagram.com/p/{post_id}"
+            result = self._result(post_id)
             
-            logger.info("instagram_post_published", post_id=post_id, url=post_url)
+            logger.info("instagram_post_published", post_id=post_id, url=result["url"])
             
-            return {
-                "success": True,
-                "post_id": post_id,
-                "url": post_url
-            }
+            return result
             
         except Exception as e:
             logger.error("instagram_publish_failed", error=str(e))
             raise
+    
+    def _result(self, post_id: str) -> dict:
+        return {
+            "success": True,
+            "post_id": post_id,
+            "url": f"https://www.instagram.com/p/{post_id}"
+        }
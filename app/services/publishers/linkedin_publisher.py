@@ -1,9 +1,12 @@
-import requests
 from app.config import settings
+from app.services.http import get_http_session
 import structlog
 
 logger = structlog.get_logger()
 
+# Author URN per access token; it never changes for a token
+_user_urn_cache = {}
+
 
 class LinkedInPublisher:
     """Publisher for LinkedIn using API"""
@@ -13,28 +16,39 @@ class LinkedInPublisher:
         self.base_url = "https://api.linkedin.com/v2"
     
     def get_user_urn(self) -> str:
-        """Get LinkedIn user URN"""
+        """Get LinkedIn user URN (cached per access token)"""
+        cached = _user_urn_cache.get(self.access_token)
+        if cached:
+            return cached
+        
         headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json"
         }
         
-        response = requests.get(
+        response = get_http_session().get(
             f"{self.base_url}/me",
             headers=headers
         )
         response.raise_for_status()
         
         user_id = response.json()["id"]
-        return f"urn:li:person:{user_id}"
+        user_urn = f"urn:li:person:{user_id}"
+        _user_urn_cache[self.access_token] = user_urn
+        
+        logger.info("linkedin_user_urn_cached", user_urn=user_urn)
+        
+        return user_urn
     
-    def publish_post(self, content: str, media_urls: list = None) -> dict:
+    def publish_post(self, content: str, media_urls: list = None, ledger=None) -> dict:
         """
         Publish a LinkedIn post.
         
         Args:
             content: Post text
             media_urls: Optional list of media URLs
+            ledger: Optional PublishLedger; a post recorded by an earlier
+                attempt is returned instead of posted again
         
         Returns:
             dict with post_id and url
@@ -42,6 +56,15 @@ class LinkedInPublisher:
         try:
             logger.info("publishing_linkedin_post")
             
+            post_id = ledger.get("post") if ledger else None
+            if post_id:
+                logger.info("linkedin_post_already_published", post_id=post_id)
+                return {
+                    "success": True,
+                    "post_id": post_id,
+                    "url": f"https://www.linkedin.com/feed/update/{post_id}"
+                }
+            
             user_urn = self.get_user_urn()
             
             headers = {
@@ -71,7 +94,7 @@ class LinkedInPublisher:
             if media_urls:
                 payload["specificContent"]["com.linkedin.ugc.ShareContent"]["shareMediaCategory"] = "IMAGE"
             
-            response = requests.post(
+            response = get_http_session().post(
                 f"{self.base_url}/ugcPosts",
                 headers=headers,
                 json=payload
@@ -79,6 +102,8 @@ class LinkedInPublisher:
             response.raise_for_status()
             
             post_id = response.headers.get("X-RestLi-Id")
+            if ledger:
+                ledger.record("post", post_id)
             post_url = f"https://www.linkedin.com/feed/update/{post_id}"
             
             logger.info("linkedin_post_published", post_id=post_id, url=post_url)
@@ -1,26 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from app.config import settings
+import hashlib
 import structlog
+import time
 
 logger = structlog.get_logger()
 
+# Max recipients per provider request
+PROVIDER_CHUNK_SIZES = {
+    "resend": 50,
+    "sendgrid": 1000,
+}
+
+_sendgrid_client = None
+_resend_module = None
+
+
+def _get_resend():
+    """Import and configure the Resend SDK once per process"""
+    global _resend_module
+    if _resend_module is None:
+        import resend
+        resend.api_key = settings.RESEND_API_KEY
+        _resend_module = resend
+    return _resend_module
+
+
+def _get_sendgrid():
+    """Build the SendGrid client once per process"""
+    global _sendgrid_client
+    if _sendgrid_client is None:
+        from sendgrid import SendGridAPIClient
+        _sendgrid_client = SendGridAPIClient(settings.SENDGRID_API_KEY)
+    return _sendgrid_client
+
+
+class NewsletterDeliveryError(Exception):
+    """Raised when some chunks could not be delivered after retries"""
+
+    def __init__(self, failed_chunks: list, sent_chunks: int, total_chunks: int):
+        self.failed_chunks = failed_chunks
+        self.sent_chunks = sent_chunks
+        self.total_chunks = total_chunks
+        super().__init__(
+            f"{len(failed_chunks)} of {total_chunks} newsletter chunks failed"
+        )
+
 
 class NewsletterPublisher:
     """Publisher for email newsletters"""
     
     def __init__(self):
         self.provider = settings.EMAIL_PROVIDER
+        self.chunk_size = settings.NEWSLETTER_CHUNK_SIZE or PROVIDER_CHUNK_SIZES.get(self.provider, 50)
+        self.max_parallel = settings.NEWSLETTER_MAX_PARALLEL
+        self.chunk_retries = settings.NEWSLETTER_CHUNK_RETRIES
     
-    def publish_newsletter(self, subject: str, html_content: str, recipients: list = None) -> dict:
+    def publish_newsletter(
+        self,
+        subject: str,
+        html_content: str,
+        recipients: list = None,
+        ledger=None
+    ) -> dict:
         """
         Send newsletter email.
         
+        Recipients are split into provider-sized chunks that are sent
+        concurrently. When a ledger is given, each sent chunk is recorded so
+        a retried run only sends the chunks that are still missing.
+        
         Args:
             subject: Email subject line
             html_content: HTML email body
             recipients: List of recipient emails (default: send to self)
+            ledger: Optional PublishLedger used to resume a delivery
         
         Returns:
-            dict with success status and email_id
+            dict with success status and email_ids
         """
         try:
             logger.info("publishing_newsletter", provider=self.provider)
@@ -29,26 +86,102 @@ class NewsletterPublisher:
                 # Default to sending to yourself
                 recipients = [settings.FROM_EMAIL]
             
-            if self.provider == "resend":
-                result = self._send_resend(subject, html_content, recipients)
-            elif self.provider == "sendgrid":
-                result = self._send_sendgrid(subject, html_content, recipients)
-            else:
+            if self.provider not in ("resend", "sendgrid"):
                 raise ValueError(f"Unknown email provider: {self.provider}")
             
-            logger.info("newsletter_published", recipient_count=len(recipients))
+            chunks = [
+                recipients[i:i + self.chunk_size]
+                for i in range(0, len(recipients), self.chunk_size)
+            ]
             
-            return result
+            fingerprint = self._fingerprint(subject, recipients)
+            email_ids = []
+            pending = []
+            for i in range(len(chunks)):
+                step = f"chunk:{fingerprint}:{i}"
+                if ledger and ledger.has(step):
+                    email_ids.append(ledger.get(step))
+                else:
+                    pending.append(i)
+            
+            if len(pending) < len(chunks):
+                logger.info(
+                    "newsletter_resuming",
+                    sent_chunks=len(chunks) - len(pending),
+                    pending_chunks=len(pending)
+                )
+            
+            failed = []
+            
+            with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+                futures = {
+                    executor.submit(self._send_chunk, subject, html_content, chunks[i]): i
+                    for i in pending
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error("newsletter_chunk_failed", chunk=index, error=str(e))
+                        failed.append(index)
+                        continue
+                    
+                    email_ids.append(result.get("email_id"))
+                    if ledger:
+                        ledger.record(f"chunk:{fingerprint}:{index}", result.get("email_id"))
+            
+            sent = len(chunks) - len(failed)
+            
+            if failed:
+                raise NewsletterDeliveryError(sorted(failed), sent, len(chunks))
+            
+            logger.info(
+                "newsletter_published",
+                recipient_count=len(recipients),
+                chunk_count=len(chunks)
+            )
+            
+            return {
+                "success": True,
+                "email_id": email_ids[0] if email_ids else None,
+                "email_ids": email_ids,
+                "provider": self.provider,
+                "chunk_count": len(chunks),
+                "recipient_count": len(recipients)
+            }
             
         except Exception as e:
             logger.error("newsletter_publish_failed", error=str(e))
             raise
     
+    def _fingerprint(self, subject: str, recipients: list) -> str:
+        """Ties recorded chunks to the exact recipient list and chunking"""
+        return hashlib.sha1(
+            "\n".join([subject, str(self.chunk_size), *recipients]).encode()
+        ).hexdigest()[:12]
+    
+    def _send_chunk(self, subject: str, html_content: str, recipients: list) -> dict:
+        """Send one chunk, retrying with exponential backoff"""
+        for attempt in range(self.chunk_retries + 1):
+            try:
+                if self.provider == "resend":
+                    return self._send_resend(subject, html_content, recipients)
+                return self._send_sendgrid(subject, html_content, recipients)
+            except Exception as e:
+                if attempt == self.chunk_retries:
+                    raise
+                logger.warning(
+                    "newsletter_chunk_retry",
+                    attempt=attempt + 1,
+                    recipient_count=len(recipients),
+                    error=str(e)
+                )
+                time.sleep(2 ** attempt)
+    
     def _send_resend(self, subject: str, html_content: str, recipients: list) -> dict:
         """Send via Resend"""
-        import resend
-        
-        resend.api_key = settings.RESEND_API_KEY
+        resend = _get_resend()
         
         email_data = {
             "from": settings.FROM_EMAIL,
@@ -67,7 +200,6 @@ class NewsletterPublisher:
     
     def _send_sendgrid(self, subject: str, html_content: str, recipients: list) -> dict:
         """Send via SendGrid"""
-        from sendgrid import SendGridAPIClient
         from sendgrid.helpers.mail import Mail
         
         message = Mail(
@@ -77,8 +209,7 @@ class NewsletterPublisher:
             html_content=html_content
         )
         
-        sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-        response = sg.send(message)
+        response = _get_sendgrid().send(message)
         
         return {
             "success": True,
@@ -0,0 +1,31 @@
+from app.models import Platform
+from app.services.publishers.twitter_publisher import TwitterPublisher
+from app.services.publishers.linkedin_publisher import LinkedInPublisher
+from app.services.publishers.instagram_publisher import InstagramPublisher
+from app.services.publishers.newsletter_publisher import NewsletterPublisher
+
+PUBLISHER_CLASSES = {
+    Platform.TWITTER: TwitterPublisher,
+    Platform.LINKEDIN: LinkedInPublisher,
+    Platform.INSTAGRAM: InstagramPublisher,
+    Platform.NEWSLETTER: NewsletterPublisher,
+}
+
+_publishers = {}
+
+
+def get_publisher(platform: Platform):
+    """
+    Publisher for a platform, built once per process and reused by every
+    task (the worker bootstrap builds them right after fork).
+    """
+    publisher = _publishers.get(platform)
+    if publisher is None:
+        publisher = PUBLISHER_CLASSES[platform]()
+        _publishers[platform] = publisher
+    return publisher
+
+
+def reset_publishers() -> None:
+    """Drop the cached publishers (worker process shutdown)"""
+    _publishers.clear()
@@ -1,52 +1,104 @@
-import tweepy
+import requests
 from app.config import settings
+from app.services.rate_limits import RateLimitExceeded, record_quota, seconds_until_available
+from app.services.http import get_http_session
 import structlog
+import time
 
 logger = structlog.get_logger()
 
+CREATE_TWEET_ENDPOINT = "create_tweet"
+
 
 class TwitterPublisher:
     """Publisher for Twitter/X using API v2"""
     
     def __init__(self):
-        # Twitter API v2 client
+        import tweepy
+        
+        # Twitter API v2 client. Rate limits are surfaced as RateLimitExceeded
+        # rather than slept through, so the worker slot is released.
+        # Raw responses give us the x-rate-limit-* headers.
         self.client = tweepy.Client(
             bearer_token=settings.TWITTER_BEARER_TOKEN,
             consumer_key=settings.TWITTER_API_KEY,
             consumer_secret=settings.TWITTER_API_SECRET,
             access_token=settings.TWITTER_ACCESS_TOKEN,
             access_token_secret=settings.TWITTER_ACCESS_SECRET,
-            wait_on_rate_limit=True
+            return_type=requests.Response,
+            wait_on_rate_limit=False
         )
+        # Reuse the pooled keep-alive session instead of one per client
+        self.client.session = get_http_session()
     
-    def publish_thread(self, tweets: list) -> dict:
+    def publish_thread(self, tweets: list, ledger=None) -> dict:
         """
         Publish a Twitter thread.
         
         Args:
             tweets: List of tweet texts
+            ledger: Optional PublishLedger; tweets recorded there by an earlier
+                attempt are skipped and the thread continues after them
         
         Returns:
             dict with thread_id and tweet_ids
+        
+        Raises:
+            RateLimitExceeded: quota exhausted; `progress` holds posted tweet ids
         """
+        import tweepy
+        
+        tweet_ids = []
+        if ledger:
+            for i in range(len(tweets)):
+                tweet_id = ledger.get(f"tweet:{i}")
+                if tweet_id is None:
+                    break
+                tweet_ids.append(tweet_id)
+        
         try:
-            logger.info("publishing_twitter_thread", tweet_count=len(tweets))
+            logger.info(
+                "publishing_twitter_thread",
+                tweet_count=len(tweets),
+                already_posted=len(tweet_ids)
+            )
             
-            tweet_ids = []
-            previous_tweet_id = None
+            wait = seconds_until_available(
+                "twitter", CREATE_TWEET_ENDPOINT, needed=len(tweets) - len(tweet_ids)
+            )
+            if wait:
+                raise RateLimitExceeded("twitter", CREATE_TWEET_ENDPOINT, wait, progress=tweet_ids)
+            
+            previous_tweet_id = tweet_ids[-1] if tweet_ids else None
             
-            for i, tweet_text in enumerate(tweets):
+            for i in range(len(tweet_ids), len(tweets)):
+                tweet_text = tweets[i]
+                
                 # Post tweet, reply to previous if it's a thread
-                if previous_tweet_id:
-                    response = self.client.create_tweet(
-                        text=tweet_text,
-                        in_reply_to_tweet_id=previous_tweet_id
+                try:
+                    if previous_tweet_id:
+                        response = self.client.create_tweet(
+                            text=tweet_text,
+                            in_reply_to_tweet_id=previous_tweet_id
+                        )
+                    else:
+                        response = self.client.create_tweet(text=tweet_text)
+                except tweepy.TooManyRequests as e:
+                    reset_at = int(e.response.headers.get("x-rate-limit-reset", time.time() + 900))
+                    record_quota("twitter", CREATE_TWEET_ENDPOINT, 0, reset_at)
+                    raise RateLimitExceeded(
+                        "twitter",
+                        CREATE_TWEET_ENDPOINT,
+                        reset_at - time.time(),
+                        progress=tweet_ids
                     )
-                else:
-                    response = self.client.create_tweet(text=tweet_text)
                 
-                tweet_id = response.data['id']
+                self._record_quota(response)
+                
+                tweet_id = response.json()["data"]["id"]
                 tweet_ids.append(tweet_id)
+                if ledger:
+                    ledger.record(f"tweet:{i}", tweet_id)
                 previous_tweet_id = tweet_id
                 
                 logger.info(
@@ -71,6 +123,23 @@ class TwitterPublisher:
                 "url": thread_url
             }
             
+        except RateLimitExceeded as e:
+            logger.warning(
+                "twitter_rate_limited",
+                retry_after=e.retry_after,
+                posted=len(e.progress)
+            )
+            raise
         except Exception as e:
             logger.error("twitter_publish_failed", error=str(e))
             raise
+    
+    def _record_quota(self, response: requests.Response):
+        """Track remaining create_tweet quota from the response headers"""
+        record_quota(
+            "twitter",
+            CREATE_TWEET_ENDPOINT,
+            response.headers.get("x-rate-limit-remaining"),
+            response.headers.get("x-rate-limit-reset"),
+            limit=response.headers.get("x-rate-limit-limit")
+        )
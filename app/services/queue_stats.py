@@ -0,0 +1,64 @@
+from app.redis_client import get_redis
+import structlog
+import time
+
+logger = structlog.get_logger()
+
+QUEUES = ("ingestion", "generation", "publishing", "notifications")
+
+# task_id -> start time of tasks currently running on the queue
+RUNNING_KEY = "queue:running:{queue}"
+
+# Most recent run times (seconds) on the queue, newest first
+RUNTIMES_KEY = "queue:runtimes:{queue}"
+RUNTIME_SAMPLES = 100
+
+
+def task_started(queue: str, task_id: str) -> None:
+    """Record a task as running (called from the worker's task_prerun)"""
+    try:
+        get_redis().hset(RUNNING_KEY.format(queue=queue), task_id, time.time())
+    except Exception as e:
+        logger.warning("queue_stats_update_failed", queue=queue, error=str(e))
+
+
+def task_finished(queue: str, task_id: str, runtime: float) -> None:
+    """Drop a task from the running set and keep its run time as a sample"""
+    try:
+        with get_redis().pipeline(transaction=False) as pipe:
+            pipe.hdel(RUNNING_KEY.format(queue=queue), task_id)
+            pipe.lpush(RUNTIMES_KEY.format(queue=queue), round(runtime, 3))
+            pipe.ltrim(RUNTIMES_KEY.format(queue=queue), 0, RUNTIME_SAMPLES - 1)
+            pipe.execute()
+    except Exception as e:
+        logger.warning("queue_stats_update_failed", queue=queue, error=str(e))
+
+
+def queue_snapshot(queue: str, stale_after: float) -> dict:
+    """
+    Depth, running count and mean recent run time of a queue.
+
+    Depth is the length of the broker list (Celery's Redis transport keeps
+    each queue as a list named after it). Running entries older than
+    stale_after belong to workers that died mid-task and are removed.
+    """
+    redis = get_redis()
+    running_key = RUNNING_KEY.format(queue=queue)
+
+    with redis.pipeline(transaction=False) as pipe:
+        pipe.llen(queue)
+        pipe.hgetall(running_key)
+        pipe.lrange(RUNTIMES_KEY.format(queue=queue), 0, -1)
+        depth, running, runtimes = pipe.execute()
+
+    cutoff = time.time() - stale_after
+    stale = [task_id for task_id, started in running.items() if float(started) < cutoff]
+    if stale:
+        redis.hdel(running_key, *stale)
+
+    samples = [float(runtime) for runtime in runtimes]
+    return {
+        "depth": depth,
+        "running": len(running) - len(stale),
+        "mean_runtime": sum(samples) / len(samples) if samples else None,
+    }
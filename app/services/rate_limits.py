@@ -0,0 +1,82 @@
+from app.redis_client import get_redis
+import structlog
+import time
+
+logger = structlog.get_logger()
+
+QUOTA_KEY = "ratelimit:{platform}:{endpoint}"
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised instead of sleeping when a platform quota is exhausted.
+    
+    Carries how long to wait and whatever was already published, so the
+    caller can persist progress and reschedule itself.
+    """
+
+    def __init__(self, platform: str, endpoint: str, retry_after: int, progress: list = None):
+        self.platform = platform
+        self.endpoint = endpoint
+        self.retry_after = max(int(retry_after), 1)
+        self.progress = progress or []
+        super().__init__(
+            f"{platform} rate limit on {endpoint}, retry in {self.retry_after}s"
+        )
+
+
+def record_quota(platform: str, endpoint: str, remaining, reset_at, limit=None) -> None:
+    """Store the quota reported by the platform's rate-limit headers (limit is optional)"""
+    if remaining is None or reset_at is None:
+        return
+    
+    key = QUOTA_KEY.format(platform=platform, endpoint=endpoint)
+    reset_at = int(reset_at)
+    ttl = reset_at - int(time.time())
+    if ttl <= 0:
+        return
+    
+    quota = {"remaining": int(remaining), "reset_at": reset_at}
+    if limit is not None:
+        quota["limit"] = int(limit)
+    
+    client = get_redis()
+    with client.pipeline() as pipe:
+        pipe.hset(key, mapping=quota)
+        pipe.expire(key, ttl)
+        pipe.execute()
+
+
+def seconds_until_available(platform: str, endpoint: str, needed: int = 1) -> int:
+    """
+    Seconds to wait before `needed` calls fit in the known quota.
+    
+    Returns 0 when the quota is unknown or sufficient, so work is deferred
+    before the platform starts refusing calls partway through. `needed` is
+    capped at the window's limit: more than a full window can never fit,
+    and the caller handles the remainder when the platform refuses.
+    """
+    key = QUOTA_KEY.format(platform=platform, endpoint=endpoint)
+    quota = get_redis().hgetall(key)
+    if not quota:
+        return 0
+    
+    if "limit" in quota:
+        needed = min(needed, int(quota["limit"]))
+    
+    remaining = int(quota.get("remaining", needed))
+    reset_at = int(quota.get("reset_at", 0))
+    wait = reset_at - int(time.time())
+    
+    if remaining >= needed or wait <= 0:
+        return 0
+    
+    logger.info(
+        "rate_limit_quota_insufficient",
+        platform=platform,
+        endpoint=endpoint,
+        needed=needed,
+        remaining=remaining,
+        retry_after=wait
+    )
+    return wait
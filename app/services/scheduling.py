@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.models import GeneratedContent, ApprovalStatus, Platform
+import zlib
+
+
+def slot_interval(platform: Platform) -> timedelta:
+    """
+    Minimum spacing between two publishes on a platform.
+    
+    Defaults stay well inside each platform's posting limits (a Twitter
+    thread is several create_tweet calls, newsletters go to every subscriber).
+    """
+    seconds = {
+        Platform.TWITTER: settings.PUBLISH_SLOT_INTERVAL_TWITTER,
+        Platform.LINKEDIN: settings.PUBLISH_SLOT_INTERVAL_LINKEDIN,
+        Platform.INSTAGRAM: settings.PUBLISH_SLOT_INTERVAL_INSTAGRAM,
+        Platform.NEWSLETTER: settings.PUBLISH_SLOT_INTERVAL_NEWSLETTER,
+    }[platform]
+    return timedelta(seconds=seconds)
+
+
+def fit_to_window(moment: datetime) -> datetime:
+    """Move a time forward into the configured daily posting window (UTC)"""
+    start = settings.PUBLISH_WINDOW_START_HOUR
+    end = settings.PUBLISH_WINDOW_END_HOUR
+    
+    if start == end:
+        return moment
+    
+    window_start = moment.replace(hour=start, minute=0, second=0, microsecond=0)
+    
+    if start < end:
+        if moment.hour < start:
+            return window_start
+        if moment.hour >= end:
+            return window_start + timedelta(days=1)
+        return moment
+    
+    # Window spans midnight, e.g. 20 -> 4
+    if end <= moment.hour < start:
+        return window_start
+    return moment
+
+
+def next_slot(platform: Platform, last_slot: datetime = None, now: datetime = None) -> datetime:
+    """First slot after `now` that is at least one interval after `last_slot`"""
+    now = now or datetime.now(timezone.utc)
+    candidate = now
+    if last_slot is not None and last_slot + slot_interval(platform) > candidate:
+        candidate = last_slot + slot_interval(platform)
+    return fit_to_window(candidate)
+
+
+async def assign_publish_slot(db: AsyncSession, platform: Platform) -> datetime:
+    """
+    Reserve the next free slot for a platform.
+    
+    A transaction-scoped advisory lock per platform serializes concurrent
+    approvals so two items never get the same slot. The caller commits.
+    """
+    return (await assign_publish_slots(db, platform, 1))[0]
+
+
+async def assign_publish_slots(db: AsyncSession, platform: Platform, count: int) -> list:
+    """Reserve the next `count` consecutive slots for a platform under one lock"""
+    lock_key = zlib.crc32(f"publish_slots:{platform.value}".encode())
+    await db.execute(select(func.pg_advisory_xact_lock(lock_key)))
+    
+    # Slots stay on dispatched rows, and published rows count with their
+    # actual publish time, so spacing holds after the queue drains
+    last_slot = await db.scalar(
+        select(func.max(func.greatest(GeneratedContent.publish_at, GeneratedContent.published_at))).filter(
+            GeneratedContent.platform == platform,
+            GeneratedContent.approval_status.in_([ApprovalStatus.APPROVED, ApprovalStatus.PUBLISHED])
+        )
+    )
+    
+    slots = []
+    for _ in range(count):
+        last_slot = next_slot(platform, last_slot)
+        slots.append(last_slot)
+    
+    return slots
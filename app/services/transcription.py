@@ -1,5 +1,3 @@
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 from typing import Optional
 import structlog
 from app.config import settings
@@ -24,6 +22,9 @@ class TranscriptionService:
         Returns:
             dict with 'text' and 'segments' for timestamped transcript
         """
+        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+        
         try:
             logger.info("fetching_youtube_transcript", video_id=video_id)
             
@@ -1,4 +1,3 @@
-import yt_dlp
 import structlog
 
 logger = structlog.get_logger()
@@ -17,6 +16,8 @@ class YouTubeDownloader:
         Returns:
             dict with title, description, duration, etc.
         """
+        import yt_dlp
+        
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
@@ -0,0 +1,110 @@
+from app.celery_app import celery_app
+from app.workers.db import DatabaseTask
+from app.workers.pipeline import start_pipeline
+from app.models import PipelineJob, SourceContent, ContentStatus
+from app.redis_client import get_redis
+from app.services.admission import pop_deferred, defer_pipeline, deferred_sources, RELEASE_LOCK_KEY
+from app.config import settings
+from datetime import datetime, timedelta, timezone
+from redis.exceptions import LockError
+import structlog
+
+logger = structlog.get_logger()
+
+# A job younger than this may still be between its commit and its
+# enqueue (or deferral) in the webhook
+ORPHAN_GRACE = timedelta(minutes=2)
+ORPHAN_SWEEP_PAGE = 100
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def release_deferred_pipelines(self):
+    """
+    Celery beat task: start deferred pipelines, oldest first, while the
+    ingestion/generation load is under the admission thresholds.
+
+    The started ingestion task becomes the job's task_id, as for pipelines
+    started by the webhook. A source whose pipeline can't be started is put
+    back at its original position. Pending sources left without a pipeline
+    (the webhook failed between committing the job and enqueueing or
+    deferring it) are deferred again first.
+
+    Runs hold a Redis lock: a source popped by one run has no task_id
+    until it is started, and an overlapping sweep would defer it twice.
+    """
+    db = self.db
+    lock = get_redis().lock(RELEASE_LOCK_KEY, timeout=settings.ADMISSION_RELEASE_INTERVAL * 4)
+    if not lock.acquire(blocking=False):
+        return {"released": 0, "skipped": "locked"}
+
+    try:
+        redeferred = _redefer_orphans(db)
+        released = _release(db)
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("deferred_release_lock_expired")
+
+    if released or redeferred:
+        logger.info("deferred_pipelines_released", count=released, redeferred=redeferred)
+
+    return {"released": released, "redeferred": redeferred}
+
+
+def _redefer_orphans(db) -> int:
+    """
+    Defer pending sources whose job never got a pipeline, at their creation time.
+
+    Deferred sources also have no task_id, so candidates are paged by job id
+    and those already in the deferred queue are skipped; a page of them
+    can't hide the orphans behind it.
+    """
+    cutoff = datetime.now(timezone.utc) - ORPHAN_GRACE
+    redeferred = 0
+    last_id = 0
+
+    while True:
+        page = db.query(PipelineJob.id, PipelineJob.source_id, PipelineJob.created_at).join(
+            PipelineJob.source
+        ).filter(
+            PipelineJob.id > last_id,
+            PipelineJob.task_id.is_(None),
+            PipelineJob.created_at < cutoff,
+            SourceContent.status == ContentStatus.PENDING
+        ).order_by(PipelineJob.id).limit(ORPHAN_SWEEP_PAGE).all()
+        db.commit()
+        if not page:
+            break
+
+        deferred = deferred_sources([source_id for _, source_id, _ in page])
+        for _, source_id, created_at in page:
+            if source_id not in deferred:
+                defer_pipeline(source_id, created_at.timestamp())
+                redeferred += 1
+
+        last_id = page[-1].id
+
+    return redeferred
+
+
+def _release(db) -> int:
+    released = 0
+
+    for source_id, deferred_at in pop_deferred():
+        try:
+            task = start_pipeline(source_id)
+        except Exception as e:
+            logger.error("deferred_pipeline_start_failed", source_id=source_id, error=str(e))
+            defer_pipeline(source_id, deferred_at)
+            continue
+
+        job = db.query(PipelineJob).filter(
+            PipelineJob.source_id == source_id
+        ).order_by(PipelineJob.id.desc()).first()
+        if job is not None:
+            job.task_id = task.id
+            db.commit()
+        released += 1
+
+    return released
@@ -0,0 +1,142 @@
+from celery.signals import worker_init, worker_shutdown, worker_process_init, worker_process_shutdown
+from app import database
+from app.celery_app import celery_app
+from app.config import settings
+from app.metrics import start_metrics_server, mark_process_dead
+import os
+import time
+import structlog
+
+logger = structlog.get_logger()
+
+
+def _warm_database():
+    # Open one pooled connection ahead of the first task
+    database.engine.connect().close()
+
+
+def _warm_http():
+    from app.services.http import get_http_session
+    get_http_session()
+
+
+def _warm_generation():
+    from app.ai.llm import get_llm_client
+    from app.ai.state_machine import get_compiled_workflow
+    get_llm_client()
+    get_compiled_workflow()
+
+
+def _warm_publishers():
+    from app.models import Platform
+    from app.services.publishers.registry import get_publisher
+    # One platform's missing credentials shouldn't leave the others cold
+    for platform in Platform:
+        try:
+            get_publisher(platform)
+        except Exception as e:
+            logger.warning("publisher_warmup_failed", platform=platform.value, error=str(e))
+
+
+# What each queue's tasks use; a worker only builds what its queues need
+QUEUE_WARMUPS = {
+    "ingestion": [],
+    "generation": [_warm_generation],
+    "publishing": [_warm_http, _warm_publishers],
+    "notifications": [],
+}
+
+
+def _consumed_queues() -> list:
+    """Queues selected with -Q, or every routed queue when none were"""
+    selected = [name for name in celery_app.amqp.queues.consume_from if name in QUEUE_WARMUPS]
+    return selected or list(QUEUE_WARMUPS)
+
+
+def _forks_children(worker) -> bool:
+    """Whether tasks run in prefork children rather than in this process"""
+    pool = getattr(worker, "pool_cls", None) or celery_app.conf.worker_pool
+    name = pool if isinstance(pool, str) else pool.__module__
+    return "prefork" in name or name == "processes"
+
+
+def _warm_up():
+    """
+    Open a first connection and build the clients, publishers and compiled
+    workflow used by this worker's queues. A failed step is logged and
+    left to the lazy path.
+    """
+    start = time.perf_counter()
+    queues = _consumed_queues()
+    steps = [_warm_database]
+    for queue in queues:
+        steps += [step for step in QUEUE_WARMUPS[queue] if step not in steps]
+    
+    for step in steps:
+        try:
+            step()
+        except Exception as e:
+            logger.warning("worker_warmup_failed", step=step.__name__, error=str(e))
+    
+    logger.info(
+        "worker_warmed_up",
+        pid=os.getpid(),
+        queues=queues,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pgbouncer=settings.DB_USE_PGBOUNCER,
+        duration_ms=int((time.perf_counter() - start) * 1000)
+    )
+
+
+@worker_init.connect
+def init_worker(sender=None, **kwargs):
+    """
+    Worker main process setup.
+    
+    Exposes pool metrics, and warms up here when tasks run in this process
+    (threads, gevent or solo pools); prefork children warm up after fork.
+    """
+    if settings.WORKER_METRICS_PORT:
+        start_metrics_server(settings.WORKER_METRICS_PORT)
+    
+    if not _forks_children(sender):
+        _warm_up()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """
+    Build per-process resources once, right after fork.
+    
+    The parent's pool must not be shared across fork, so it is discarded
+    without closing the parent's connections and SessionLocal is rebound.
+    """
+    database.engine.dispose(close=False)
+    database.engine = database.build_engine()
+    database.SessionLocal.configure(bind=database.engine)
+    
+    _warm_up()
+
+
+def _tear_down():
+    """Close what _warm_up built (or what tasks built lazily)"""
+    from app.ai.llm import close_llm_client
+    from app.services.http import close_http_session
+    from app.services.publishers.registry import reset_publishers
+    
+    reset_publishers()
+    close_http_session()
+    close_llm_client()
+    database.engine.dispose()
+
+
+@worker_shutdown.connect
+def shutdown_worker(**kwargs):
+    _tear_down()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(pid=None, **kwargs):
+    _tear_down()
+    mark_process_dead(pid or os.getpid())
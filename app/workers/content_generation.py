@@ -1,32 +1,15 @@
-from celery import Task
-from sqlalchemy.orm import Session
 from app.celery_app import celery_app
-from app.database import SessionLocal
-from app.models import SourceContent, GeneratedContent, Platform, ApprovalStatus
+from app.workers.db import DatabaseTask
+from app.models import SourceContent, GeneratedContent, Platform, ApprovalStatus, ContentStatus, PipelineStage
+from app.services.pipeline_jobs import record_stage
+from app.services.content_events import content_event, publish_content_events
 from app.ai.state_machine import run_content_generation
 import structlog
-import json
 
 logger = structlog.get_logger()
 
 
-class DatabaseTask(Task):
-    """Base task that provides a database session"""
-    _db = None
-    
-    @property
-    def db(self) -> Session:
-        if self._db is None:
-            self._db = SessionLocal()
-        return self._db
-    
-    def after_return(self, *args, **kwargs):
-        if self._db is not None:
-            self._db.close()
-            self._db = None
-
-
-@celery_app.task(base=DatabaseTask, bind=True, max_retries=2)
+@celery_app.task(base=DatabaseTask, bind=True, max_retries=2, acks_late=True, reject_on_worker_lost=True)
 def generate_content(self, source_id: int):
     """
     Celery task to generate content for all platforms using LangGraph
@@ -35,7 +18,10 @@ def generate_content(self, source_id: int):
     1. Fetch source content with transcript
     2. Run LangGraph state machine
     3. Save generated content to database
-    4. Trigger notification worker
+    4. Return the new content ids for the pipeline callback
+    
+    Redelivered after a lost worker (acks_late), a source that already has
+    generated content returns the existing ids instead of generating again.
     """
     db = self.db
     
@@ -45,6 +31,12 @@ def generate_content(self, source_id: int):
         if not source or not source.transcript:
             raise ValueError(f"Source {source_id} not found or has no transcript")
         
+        existing_ids = _existing_content_ids(db, source_id)
+        if existing_ids:
+            return _already_generated(db, source_id, existing_ids)
+        
+        record_stage(db, source_id, PipelineStage.GENERATION, ContentStatus.PROCESSING)
+        
         logger.info(
             "content_generation_started",
             source_id=source_id,
@@ -55,12 +47,18 @@ def generate_content(self, source_id: int):
         metadata = {
             "title": source.title,
             "description": source.description,
-            **(source.metadata or {})
+            **(source.metadata_ or {})
         }
         
         # Run the AI workflow
         generated = run_content_generation(source.transcript, metadata)
         
+        # Another delivery may have saved content while this one generated
+        db.query(SourceContent.id).filter(SourceContent.id == source_id).with_for_update().one()
+        existing_ids = _existing_content_ids(db, source_id)
+        if existing_ids:
+            return _already_generated(db, source_id, existing_ids)
+        
         # Save generated content to database
         content_records = []
         
@@ -98,13 +96,18 @@ def generate_content(self, source_id: int):
                 source_id=source_id,
                 platform=Platform.NEWSLETTER,
                 content=newsletter_data.get("content", ""),
-                metadata=json.dumps(newsletter_metadata),
+                metadata_=newsletter_metadata,
                 approval_status=ApprovalStatus.PENDING_APPROVAL
             )
             db.add(newsletter_record)
             content_records.append(("newsletter", newsletter_record))
         
         db.commit()
+        publish_content_events([
+            content_event("created", record, video_title=source.title, video_url=source.video_url)
+            for platform, record in content_records
+        ])
+        record_stage(db, source_id, PipelineStage.GENERATION, ContentStatus.COMPLETED)
         
         logger.info(
             "content_generation_complete",
@@ -112,17 +115,40 @@ def generate_content(self, source_id: int):
             platforms=len(content_records)
         )
         
-        # Trigger notification for approval
-        from app.workers.notifications import send_approval_notification
-        for platform, record in content_records:
-            send_approval_notification.delay(record.id)
-        
+        # The pipeline's fan-in callback notifies once for all records
         return {
             "source_id": source_id,
             "status": "completed",
-            "generated_count": len(content_records)
+            "generated_count": len(content_records),
+            "content_ids": [record.id for platform, record in content_records]
         }
         
     except Exception as e:
         logger.error("content_generation_failed", source_id=source_id, error=str(e))
+        db.rollback()
+        record_stage(db, source_id, PipelineStage.GENERATION, ContentStatus.FAILED, error=str(e))
         raise self.retry(exc=e, countdown=120 * (2 ** self.request.retries))
+
+
+def _existing_content_ids(db, source_id: int) -> list:
+    """Ids of the content already generated for a source"""
+    return [
+        content_id for content_id, in db.query(GeneratedContent.id).filter(
+            GeneratedContent.source_id == source_id
+        ).order_by(GeneratedContent.id)
+    ]
+
+
+def _already_generated(db, source_id: int, content_ids: list) -> dict:
+    """Result for a redelivered task whose content was already saved"""
+    db.commit()
+    record_stage(db, source_id, PipelineStage.GENERATION, ContentStatus.COMPLETED)
+    
+    logger.info("content_generation_skipped", source_id=source_id, existing=len(content_ids))
+    
+    return {
+        "source_id": source_id,
+        "status": "completed",
+        "generated_count": len(content_ids),
+        "content_ids": content_ids
+    }
@@ -0,0 +1,27 @@
+from celery import Task
+from sqlalchemy.orm import Session
+from app import database
+import threading
+
+
+class DatabaseTask(Task):
+    """
+    Base task that provides a database session.
+    
+    Task objects are shared by every thread of a threads-pool worker, so
+    the session is kept per thread.
+    """
+    _local = threading.local()
+    
+    @property
+    def db(self) -> Session:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = database.SessionLocal()
+        return db
+    
+    def after_return(self, *args, **kwargs):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
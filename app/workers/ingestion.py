@@ -1,8 +1,7 @@
-from celery import Task
-from sqlalchemy.orm import Session
 from app.celery_app import celery_app
-from app.database import SessionLocal
-from app.models import SourceContent, ContentStatus
+from app.workers.db import DatabaseTask
+from app.models import SourceContent, ContentStatus, PipelineStage
+from app.services.pipeline_jobs import record_stage
 from app.services.youtube_downloader import YouTubeDownloader
 from app.services.transcription import TranscriptionService
 import structlog
@@ -11,30 +10,16 @@ from datetime import datetime
 logger = structlog.get_logger()
 
 
-class DatabaseTask(Task):
-    """Base task that provides a database session"""
-    _db = None
-    
-    @property
-    def db(self) -> Session:
-        if self._db is None:
-            self._db = SessionLocal()
-        return self._db
-    
-    def after_return(self, *args, **kwargs):
-        if self._db is not None:
-            self._db.close()
-            self._db = None
-
-
-@celery_app.task(base=DatabaseTask, bind=True, max_retries=3)
+@celery_app.task(base=DatabaseTask, bind=True, max_retries=3, acks_late=True, reject_on_worker_lost=True)
 def ingest_video(self, source_id: int):
     """
     Celery task to ingest a YouTube video:
     1. Fetch video metadata
     2. Get transcript from YouTube
     3. Store in database
-    4. Trigger content generation
+    
+    First stage of the per-source pipeline; generate_content follows it.
+    A redelivered task whose source is already ingested doesn't fetch again.
     """
     db = self.db
     downloader = YouTubeDownloader()
@@ -46,9 +31,19 @@ def ingest_video(self, source_id: int):
         if not source:
             raise ValueError(f"Source content {source_id} not found")
         
+        if source.status == ContentStatus.COMPLETED and source.transcript:
+            record_stage(db, source_id, PipelineStage.INGESTION, ContentStatus.COMPLETED)
+            logger.info("ingestion_skipped", source_id=source_id)
+            return {
+                "source_id": source_id,
+                "status": "completed",
+                "title": source.title
+            }
+        
         # Update status to processing
         source.status = ContentStatus.PROCESSING
         db.commit()
+        record_stage(db, source_id, PipelineStage.INGESTION, ContentStatus.PROCESSING)
         
         logger.info("ingestion_started", source_id=source_id, video_url=source.video_url)
         
@@ -63,7 +58,7 @@ def ingest_video(self, source_id: int):
         source.description = metadata.get('description')
         source.duration = metadata.get('duration')
         source.transcript = transcript_data['text']
-        source.metadata = {
+        source.metadata_ = {
             'uploader': metadata.get('uploader'),
             'upload_date': metadata.get('upload_date'),
             'view_count': metadata.get('view_count'),
@@ -75,6 +70,7 @@ def ingest_video(self, source_id: int):
         source.processed_at = datetime.utcnow()
         
         db.commit()
+        record_stage(db, source_id, PipelineStage.INGESTION, ContentStatus.COMPLETED)
         
         logger.info(
             "ingestion_completed",
@@ -83,9 +79,7 @@ def ingest_video(self, source_id: int):
             transcript_length=len(source.transcript)
         )
         
-        # Step 4: Trigger content generation workflow
-        from app.workers.content_generation import generate_content
-        generate_content.delay(source_id)
+        # Content generation runs next in the pipeline chain (app.workers.pipeline)
         
         return {
             "source_id": source_id,
@@ -97,11 +91,13 @@ def ingest_video(self, source_id: int):
         logger.error("ingestion_failed", source_id=source_id, error=str(e))
         
         # Update status to failed
+        db.rollback()
         source = db.query(SourceContent).filter(SourceContent.id == source_id).first()
         if source:
             source.status = ContentStatus.FAILED
             source.error_message = str(e)
             db.commit()
+        record_stage(db, source_id, PipelineStage.INGESTION, ContentStatus.FAILED, error=str(e))
         
         # Retry with exponential backoff
         raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
@@ -1,28 +1,71 @@
-from celery import Task
-from sqlalchemy.orm import Session
+from celery import group
+from jinja2 import Environment, select_autoescape
 from app.celery_app import celery_app
-from app.database import SessionLocal
-from app.models import GeneratedContent, SourceContent
+from app.workers.db import DatabaseTask
+from app.models import GeneratedContent, SourceContent, ContentStatus, PipelineStage
+from app.services.pipeline_jobs import record_stage
 from app.config import settings
+from app.redis_client import get_redis
 import structlog
 
 logger = structlog.get_logger()
 
+DIGEST_PENDING_KEY = "notifications:digest:pending"
+DIGEST_SCHEDULED_KEY = "notifications:digest:scheduled"
 
-class DatabaseTask(Task):
-    """Base task that provides a database session"""
-    _db = None
-    
-    @property
-    def db(self) -> Session:
-        if self._db is None:
-            self._db = SessionLocal()
-        return self._db
-    
-    def after_return(self, *args, **kwargs):
-        if self._db is not None:
-            self._db.close()
-            self._db = None
+# Compiled once at import, rendered per digest window
+DIGEST_TEMPLATE = Environment(autoescape=select_autoescape(default=True)).from_string("""
+<html>
+<body>
+    <h2>{{ items|length }} New Item{{ 's' if items|length != 1 }} Ready for Approval</h2>
+    
+    {% for source_title, source_items in groups %}
+    <h3>{{ source_title }}</h3>
+    {% for item in source_items %}
+    <div style="background: #f5f5f5; padding: 16px; border-radius: 8px; margin: 12px 0;">
+        <p><strong>{{ item.platform }}</strong> &middot; generated {{ item.created_at }}</p>
+        <pre style="white-space: pre-wrap; word-wrap: break-word;">{{ item.preview }}...</pre>
+        <a href="{{ item.review_url }}">Review and Approve</a>
+    </div>
+    {% endfor %}
+    {% endfor %}
+    
+    <p>
+        <a href="{{ approval_url }}" style="background: #4CAF50; color: white; padding: 12px 24px; text-decoration: none; border-radius: 4px; display: inline-block;">
+            Open Approval Queue
+        </a>
+    </p>
+</body>
+</html>
+""")
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def notify_content_ready(self, generation_result: dict):
+    """
+    Pipeline fan-in callback.
+    
+    Runs once per source after generate_content has committed every
+    platform record, and dispatches the approval notifications together.
+    """
+    content_ids = generation_result.get("content_ids", [])
+    source_id = generation_result.get("source_id")
+    
+    logger.info("content_ready", source_id=source_id, content_count=len(content_ids))
+    
+    if content_ids:
+        if settings.NOTIFICATION_DIGEST_ENABLED:
+            queue_for_digest(content_ids)
+        else:
+            group(send_approval_notification.si(content_id) for content_id in content_ids).apply_async()
+    
+    record_stage(self.db, source_id, PipelineStage.NOTIFICATION, ContentStatus.COMPLETED)
+    
+    return {
+        "source_id": source_id,
+        "status": "notified",
+        "content_ids": content_ids
+    }
 
 
 @celery_app.task(base=DatabaseTask, bind=True)
@@ -99,6 +142,97 @@ def send_approval_notification(self, content_id: int):
         raise
 
 
+def queue_for_digest(content_ids: list):
+    """
+    Buffer pending-approval items in Redis for the next digest.
+    
+    The first item of a window schedules send_approval_digest; later items
+    just join the buffer until that digest drains it.
+    """
+    client = get_redis()
+    window = settings.NOTIFICATION_DIGEST_WINDOW
+    
+    client.rpush(DIGEST_PENDING_KEY, *content_ids)
+    
+    # Expiry guards against a lost flush task leaving the window stuck open
+    if client.set(DIGEST_SCHEDULED_KEY, "1", nx=True, ex=window * 2):
+        send_approval_digest.apply_async(countdown=window)
+        logger.info("approval_digest_scheduled", window=window)
+    
+    logger.info("approval_digest_buffered", content_count=len(content_ids))
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def send_approval_digest(self):
+    """
+    Send one summary email for every item buffered during the window.
+    """
+    client = get_redis()
+    
+    # Drain the buffer and reopen the window atomically
+    with client.pipeline() as pipe:
+        pipe.lrange(DIGEST_PENDING_KEY, 0, -1)
+        pipe.delete(DIGEST_PENDING_KEY)
+        pipe.delete(DIGEST_SCHEDULED_KEY)
+        raw_ids, _, _ = pipe.execute()
+    
+    content_ids = sorted({int(content_id) for content_id in raw_ids})
+    if not content_ids:
+        return {"status": "empty", "content_count": 0}
+    
+    if not settings.ENABLE_EMAIL_NOTIFICATIONS:
+        logger.info("email_notifications_disabled", content_count=len(content_ids))
+        return
+    
+    db = self.db
+    
+    try:
+        rows = db.query(GeneratedContent, SourceContent).join(
+            SourceContent, SourceContent.id == GeneratedContent.source_id
+        ).filter(
+            GeneratedContent.id.in_(content_ids)
+        ).order_by(
+            GeneratedContent.source_id, GeneratedContent.id
+        ).all()
+        
+        groups = {}
+        items = []
+        for content, source in rows:
+            item = {
+                "platform": content.platform.value.title(),
+                "created_at": content.created_at.strftime('%Y-%m-%d %H:%M UTC') if content.created_at else "",
+                "preview": content.content[:300],
+                "review_url": f"{settings.FRONTEND_URL}/approval/{content.id}",
+            }
+            groups.setdefault(source.title or "Unknown", []).append(item)
+            items.append(item)
+        
+        if not items:
+            return {"status": "empty", "content_count": 0}
+        
+        subject = f"{len(items)} New Item{'s' if len(items) != 1 else ''} Ready for Review"
+        email_body = DIGEST_TEMPLATE.render(
+            items=items,
+            groups=list(groups.items()),
+            approval_url=f"{settings.FRONTEND_URL}/approval",
+        )
+        
+        if settings.EMAIL_PROVIDER == "resend":
+            send_resend_email(subject, email_body)
+        elif settings.EMAIL_PROVIDER == "sendgrid":
+            send_sendgrid_email(subject, email_body)
+        
+        logger.info("approval_digest_sent", content_count=len(items))
+        
+        return {"status": "sent", "content_count": len(items)}
+        
+    except Exception as e:
+        # Put the items back so the next window picks them up
+        queue_for_digest(content_ids)
+        logger.error("approval_digest_failed", content_count=len(content_ids), error=str(e))
+        raise
+
+
 def send_resend_email(subject: str, html_content: str):
     """Send email using Resend"""
     import resend
@@ -0,0 +1,41 @@
+from celery import chain
+from app.celery_app import celery_app, INGEST_VIDEO, GENERATE_CONTENT, NOTIFY_CONTENT_READY
+import structlog
+
+logger = structlog.get_logger()
+
+
+def build_pipeline(source_id: int):
+    """
+    Build the per-source canvas:
+    ingest_video -> generate_content -> notify_content_ready
+    
+    notify_content_ready is the fan-in callback: it runs once, after all
+    platform records for the source have been committed.
+    
+    Signatures are built by task name so the API can start a pipeline
+    without importing the worker modules.
+    """
+    return chain(
+        celery_app.signature(INGEST_VIDEO, args=(source_id,), immutable=True),
+        celery_app.signature(GENERATE_CONTENT, args=(source_id,), immutable=True),
+        celery_app.signature(NOTIFY_CONTENT_READY),
+    )
+
+
+def start_pipeline(source_id: int):
+    """
+    Launch the pipeline for a source and return its root (ingestion) result.
+    
+    Progress is tracked in the pipeline_job table by the tasks themselves
+    (app.services.pipeline_jobs), not by polling the result backend.
+    """
+    result = build_pipeline(source_id).apply_async()
+    
+    root = result
+    while root.parent is not None:
+        root = root.parent
+    
+    logger.info("pipeline_started", source_id=source_id, root_task_id=root.id)
+    
+    return root
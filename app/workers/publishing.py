@@ -1,36 +1,37 @@
-from celery import Task
-from sqlalchemy.orm import Session
+from celery import group
+from sqlalchemy import select, update
 from app.celery_app import celery_app
-from app.database import SessionLocal
-from app.models import GeneratedContent, ApprovalStatus, Platform
-from app.services.publishers.twitter_publisher import TwitterPublisher
-from app.services.publishers.linkedin_publisher import LinkedInPublisher
-from app.services.publishers.instagram_publisher import InstagramPublisher
-from app.services.publishers.newsletter_publisher import NewsletterPublisher
-from datetime import datetime
+from app.workers.db import DatabaseTask
+from app import database
+from app.models import GeneratedContent, ApprovalStatus, Platform, ContentStatus, PipelineStage
+from app.services.publishers.twitter_publisher import CREATE_TWEET_ENDPOINT
+from app.services.publishers.registry import get_publisher
+from app.services.rate_limits import RateLimitExceeded, seconds_until_available
+from app.services.publish_ledger import PublishLedger
+from app.services.pipeline_jobs import record_stage
+from app.services.content_events import content_event, publish_content_events
+from app.services.content_cache import invalidate_content
+from app.redis_client import get_redis
+from app.config import settings
+from datetime import datetime, timedelta, timezone
+import asyncio
+import threading
 import structlog
 import json
+import time
 
 logger = structlog.get_logger()
 
+# Caps the sessions publish_source opens on its own threads, across all
+# runs in this process; the DB pool is sized for concurrency plus this
+_source_publish_slots = threading.BoundedSemaphore(settings.PUBLISH_SOURCE_MAX_PARALLEL)
 
-class DatabaseTask(Task):
-    """Base task that provides a database session"""
-    _db = None
-    
-    @property
-    def db(self) -> Session:
-        if self._db is None:
-            self._db = SessionLocal()
-        return self._db
-    
-    def after_return(self, *args, **kwargs):
-        if self._db is not None:
-            self._db.close()
-            self._db = None
+# Items claimed by a publish_source run, kept so a redelivery can hand them on
+SOURCE_CLAIMS_KEY = "publish_source:claimed:{task_id}"
+SOURCE_CLAIMS_TTL = 24 * 60 * 60
 
 
-@celery_app.task(base=DatabaseTask, bind=True, max_retries=3)
+@celery_app.task(base=DatabaseTask, bind=True, max_retries=3, acks_late=True, reject_on_worker_lost=True)
 def publish_content(self, content_id: int):
     """
     Celery task to publish approved content to social media platforms.
@@ -40,6 +41,12 @@ def publish_content(self, content_id: int):
     2. Route to platform-specific publisher
     3. Update database with published URL
     4. Handle errors with retry logic
+    
+    Every external side effect is recorded in the publish ledger as it
+    succeeds, so retries resume from the first unfinished step instead of
+    re-posting. Rate limits don't consume retries: the task is re-enqueued
+    with a countdown until the quota resets. For the same reason the task
+    acks late: a redelivery after a lost worker resumes from the ledger.
     """
     db = self.db
     
@@ -52,48 +59,51 @@ def publish_content(self, content_id: int):
         if not content:
             raise ValueError(f"Content {content_id} not found")
         
-        if content.approval_status != ApprovalStatus.APPROVED:
+        if content.approval_status == ApprovalStatus.PUBLISHED:
+            logger.info("content_already_published", content_id=content_id)
+            return {
+                "content_id": content_id,
+                "platform": content.platform.value,
+                "status": "published",
+                "url": content.published_url
+            }
+        
+        # A failed attempt is marked FAILED before its retry runs
+        retrying = self.request.retries > 0 and content.approval_status == ApprovalStatus.FAILED
+        if content.approval_status != ApprovalStatus.APPROVED and not retrying:
             raise ValueError(f"Content {content_id} not approved for publishing")
         
-        logger.info(
-            "publishing_content",
-            content_id=content_id,
-            platform=content.platform.value
-        )
+        # Items are claimed (dispatched_at) by whoever enqueues this task;
+        # one enqueued before claims existed takes it now, unless
+        # publish_source got there first
+        if content.dispatched_at is None and not _claim(db, content_id):
+            logger.info("content_claimed_elsewhere", content_id=content_id)
+            return {
+                "content_id": content_id,
+                "platform": content.platform.value,
+                "status": "skipped"
+            }
         
-        # Route to appropriate publisher
-        result = None
+        ledger = PublishLedger(db, content_id, content.platform.value)
         
-        if content.platform == Platform.TWITTER:
-            result = _publish_twitter(content)
-        elif content.platform == Platform.LINKEDIN:
-            result = _publish_linkedin(content)
-        elif content.platform == Platform.INSTAGRAM:
-            result = _publish_instagram(content)
-        elif content.platform == Platform.NEWSLETTER:
-            result = _publish_newsletter(content)
-        else:
-            raise ValueError(f"Unknown platform: {content.platform}")
-        
-        # Update database
-        content.approval_status = ApprovalStatus.PUBLISHED
-        content.published_url = result.get("url")
-        content.published_at = datetime.utcnow()
+        return _publish(db, content, ledger)
         
-        db.commit()
+    except RateLimitExceeded as e:
+        # Completed steps are already in the ledger
+        publish_content.apply_async((content_id,), countdown=e.retry_after)
         
         logger.info(
-            "content_published",
+            "publishing_deferred",
             content_id=content_id,
-            platform=content.platform.value,
-            url=result.get("url")
+            platform=e.platform,
+            retry_after=e.retry_after,
+            published_parts=len(e.progress)
         )
         
         return {
             "content_id": content_id,
-            "platform": content.platform.value,
-            "status": "published",
-            "url": result.get("url")
+            "status": "deferred",
+            "retry_after": e.retry_after
         }
         
     except Exception as e:
@@ -104,49 +114,439 @@ def publish_content(self, content_id: int):
             retry_count=self.request.retries
         )
         
-        # Update error in database
+        _mark_failed(db, content_id, str(e), self.request.retries)
+        
+        # Retry with exponential backoff
+        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+
+
+@celery_app.task(base=DatabaseTask, bind=True, max_retries=3)
+def check_instagram_container(self, content_id: int, container_id: str, attempt: int = 0):
+    """
+    Phase 2 of Instagram publishing.
+    
+    Checks the container once and either publishes it (FINISHED), fails the
+    content (ERROR/EXPIRED or too many attempts), or reschedules itself with
+    exponential backoff. No worker sleeps while media is processing.
+    """
+    db = self.db
+    
+    content = db.query(GeneratedContent).filter(
+        GeneratedContent.id == content_id
+    ).first()
+    if not content or content.approval_status == ApprovalStatus.PUBLISHED:
+        return
+    
+    publisher = get_publisher(Platform.INSTAGRAM)
+    ledger = PublishLedger(db, content_id, content.platform.value)
+    
+    try:
+        status = publisher.get_container_status(container_id)
+        
+        logger.info(
+            "instagram_container_status",
+            content_id=content_id,
+            container_id=container_id,
+            status=status,
+            attempt=attempt
+        )
+        
+        if status in ("FINISHED", "PUBLISHED"):
+            result = publisher.publish_container(container_id, ledger=ledger)
+            return _mark_published(db, content, result)
+        
+        if status in ("ERROR", "EXPIRED"):
+            # The container can't be used again; a new publish creates another
+            ledger.discard("container")
+            _mark_failed(db, content_id, f"Instagram container {status.lower()}", content.retry_count or 0)
+            return {"content_id": content_id, "status": "failed", "container_status": status}
+        
+        if attempt + 1 >= settings.INSTAGRAM_POLL_MAX_ATTEMPTS:
+            _mark_failed(db, content_id, "Instagram container not ready in time", content.retry_count or 0)
+            return {"content_id": content_id, "status": "failed", "container_status": status}
+        
+        delay = min(
+            settings.INSTAGRAM_POLL_INITIAL_DELAY * (2 ** attempt),
+            settings.INSTAGRAM_POLL_MAX_DELAY
+        )
+        check_instagram_container.apply_async(
+            (content_id, container_id, attempt + 1),
+            countdown=delay
+        )
+        
+        return {"content_id": content_id, "status": "processing", "next_check_in": delay}
+        
+    except Exception as e:
+        logger.error(
+            "instagram_container_check_failed",
+            content_id=content_id,
+            container_id=container_id,
+            error=str(e)
+        )
+        if self.request.retries >= self.max_retries:
+            _mark_failed(db, content_id, str(e), self.request.retries)
+        raise self.retry(exc=e, countdown=30 * (2 ** self.request.retries))
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def dispatch_scheduled_content(self):
+    """
+    Celery beat task: dispatch approved content whose slot is due.
+    
+    Due rows are claimed with SKIP LOCKED so overlapping runs never
+    dispatch the same item, and are published as one group. Twitter items
+    are pushed back unless the tracked create_tweet quota covers every
+    tweet of the batch's threads so far, in slot order. Dispatched rows
+    keep their slot (assign_publish_slots spaces new slots after it) and
+    are marked with dispatched_at instead.
+    """
+    db = self.db
+    now = datetime.now(timezone.utc)
+    
+    due = db.query(GeneratedContent).filter(
+        GeneratedContent.approval_status == ApprovalStatus.APPROVED,
+        GeneratedContent.publish_at <= now,
+        GeneratedContent.dispatched_at.is_(None)
+    ).order_by(
+        GeneratedContent.publish_at
+    ).limit(
+        settings.PUBLISH_DISPATCH_BATCH
+    ).with_for_update(skip_locked=True).all()
+    
+    if not due:
+        db.commit()
+        return {"dispatched": 0}
+    
+    dispatched = []
+    postponed = 0
+    tweets_needed = 0
+    twitter_wait = 0
+    for content in due:
+        if content.platform == Platform.TWITTER:
+            # Once one thread doesn't fit, later ones wait too so order holds
+            if not twitter_wait:
+                needed = tweets_needed + len(_thread_tweets(content))
+                twitter_wait = seconds_until_available("twitter", CREATE_TWEET_ENDPOINT, needed=needed)
+            if twitter_wait:
+                content.publish_at = now + timedelta(seconds=twitter_wait)
+                postponed += 1
+                continue
+            tweets_needed = needed
+        # Marked once handed to a publish task so it isn't dispatched twice
+        content.dispatched_at = now
+        dispatched.append(content.id)
+    
+    db.commit()
+    
+    if dispatched:
+        group(publish_content.si(content_id) for content_id in dispatched).apply_async()
+    
+    logger.info(
+        "scheduled_content_dispatched",
+        dispatched=len(dispatched),
+        postponed=postponed
+    )
+    
+    return {"dispatched": len(dispatched), "postponed": postponed}
+
+
+@celery_app.task(base=DatabaseTask, bind=True, acks_late=True, reject_on_worker_lost=True)
+def publish_source(self, source_id: int):
+    """
+    Publish every approved item of a source at the same time.
+    
+    Approved items not yet handed to a publish task are claimed
+    (dispatched_at) before anything is posted, including scheduled ones
+    whose slot hasn't been dispatched: publishing the source now takes
+    them over. Queued publish_content tasks, the scheduler and concurrent
+    runs never publish the same item twice.
+    
+    Each platform publishes on its own thread (the SDKs are synchronous)
+    with its own DB session, driven by asyncio.gather, and one aggregated
+    result with per-platform URLs and timings is returned. An item that
+    fails is handed to publish_content, which retries it from the ledger.
+    
+    The claimed ids are kept in Redis before the claim commits. A
+    redelivery (the worker died mid-run) finds them there and hands every
+    item to publish_content instead of claiming again, so nothing is left
+    claimed but unpublished.
+    """
+    db = self.db
+    claims_key = SOURCE_CLAIMS_KEY.format(task_id=self.request.id)
+    
+    previous = get_redis().get(claims_key)
+    if previous is not None:
+        content_ids = json.loads(previous)
+        if content_ids:
+            group(publish_content.si(content_id) for content_id in content_ids).apply_async()
+        logger.warning("source_publish_redelivered", source_id=source_id, requeued=len(content_ids))
+        return {
+            "source_id": source_id,
+            "status": "requeued",
+            "published_count": 0,
+            "total_count": len(content_ids),
+            "duration_ms": 0,
+            "platforms": []
+        }
+    
+    content_ids = claim_source_items(db, source_id)
+    get_redis().set(claims_key, json.dumps(content_ids), ex=SOURCE_CLAIMS_TTL)
+    db.commit()
+    
+    if not content_ids:
+        logger.info("source_nothing_to_publish", source_id=source_id)
+        return {
+            "source_id": source_id,
+            "status": "nothing_to_publish",
+            "published_count": 0,
+            "total_count": 0,
+            "duration_ms": 0,
+            "platforms": []
+        }
+    
+    logger.info("publishing_source", source_id=source_id, content_count=len(content_ids))
+    
+    start = time.perf_counter()
+    results = asyncio.run(_publish_concurrently(content_ids))
+    elapsed_ms = int((time.perf_counter() - start) * 1000)
+    
+    published = sum(1 for result in results if result["status"] == "published")
+    
+    logger.info(
+        "source_published",
+        source_id=source_id,
+        published=published,
+        total=len(results),
+        duration_ms=elapsed_ms
+    )
+    
+    return {
+        "source_id": source_id,
+        "status": "published" if published == len(results) else "partial",
+        "published_count": published,
+        "total_count": len(results),
+        "duration_ms": elapsed_ms,
+        "platforms": results
+    }
+
+
+def claim_source_items(db, source_id: int) -> list:
+    """
+    Mark a source's approved, undispatched items as handed to publish_source
+    and return their ids. The caller commits.
+    
+    Rows the dispatcher is claiming at the same moment are skipped (SKIP
+    LOCKED), as the dispatcher skips ours.
+    """
+    claimable = select(GeneratedContent.id).where(
+        GeneratedContent.source_id == source_id,
+        GeneratedContent.approval_status == ApprovalStatus.APPROVED,
+        GeneratedContent.dispatched_at.is_(None)
+    ).with_for_update(skip_locked=True)
+    
+    return db.execute(
+        update(GeneratedContent).where(
+            GeneratedContent.id.in_(claimable),
+            GeneratedContent.dispatched_at.is_(None)
+        ).values(
+            dispatched_at=datetime.now(timezone.utc)
+        ).returning(
+            GeneratedContent.id
+        ).execution_options(synchronize_session=False)
+    ).scalars().all()
+
+
+async def _publish_concurrently(content_ids: list) -> list:
+    return await asyncio.gather(*(
+        asyncio.to_thread(_publish_isolated, content_id) for content_id in content_ids
+    ))
+
+
+def _claim(db, content_id: int) -> bool:
+    """Mark an unclaimed item as handed to this task; False if another task holds it"""
+    claimed = db.query(GeneratedContent).filter(
+        GeneratedContent.id == content_id,
+        GeneratedContent.dispatched_at.is_(None)
+    ).update({"dispatched_at": datetime.now(timezone.utc)}, synchronize_session=False)
+    db.commit()
+    return claimed == 1
+
+
+def _publish_isolated(content_id: int) -> dict:
+    """Publish one item with its own session; runs on a worker thread"""
+    _source_publish_slots.acquire()
+    db = database.SessionLocal()
+    start = time.perf_counter()
+    platform = None
+    
+    try:
         content = db.query(GeneratedContent).filter(
             GeneratedContent.id == content_id
         ).first()
-        if content:
-            content.approval_status = ApprovalStatus.FAILED
-            content.error_message = str(e)
-            content.retry_count = self.request.retries
-            db.commit()
+        platform = content.platform.value
         
-        # Retry with exponential backoff
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+        result = _publish(db, content, PublishLedger(db, content_id, platform))
+        
+    except RateLimitExceeded as e:
+        publish_content.apply_async((content_id,), countdown=e.retry_after)
+        result = {
+            "content_id": content_id,
+            "platform": platform,
+            "status": "deferred",
+            "retry_after": e.retry_after
+        }
+    except Exception as e:
+        # Still claimed (APPROVED, dispatched_at set): publish_content picks
+        # it up with its own retries and resumes from the ledger
+        logger.error("publishing_failed", content_id=content_id, error=str(e))
+        db.rollback()
+        publish_content.apply_async((content_id,), countdown=60)
+        result = {
+            "content_id": content_id,
+            "platform": platform,
+            "status": "retrying",
+            "error": str(e)
+        }
+    finally:
+        db.close()
+        _source_publish_slots.release()
+    
+    result["duration_ms"] = int((time.perf_counter() - start) * 1000)
+    return result
 
 
-def _publish_twitter(content: GeneratedContent) -> dict:
-    """Publish to Twitter"""
-    publisher = TwitterPublisher()
+def _publish(db, content: GeneratedContent, ledger: PublishLedger) -> dict:
+    """Route to the platform publisher and record the outcome"""
+    logger.info(
+        "publishing_content",
+        content_id=content.id,
+        platform=content.platform.value
+    )
+    record_stage(db, content.source_id, PipelineStage.PUBLISHING, ContentStatus.PROCESSING)
     
-    # Parse tweets from content_parts
-    if content.content_parts:
-        tweets = json.loads(content.content_parts)
+    # Route to appropriate publisher
+    result = None
+    
+    if content.platform == Platform.TWITTER:
+        result = _publish_twitter(content, ledger)
+    elif content.platform == Platform.LINKEDIN:
+        result = _publish_linkedin(content, ledger)
+    elif content.platform == Platform.INSTAGRAM:
+        # Phase 1: create the container, then poll until it's FINISHED
+        container_id = _create_instagram_container(content, ledger)
+        if not ledger.has("publish"):
+            check_instagram_container.apply_async(
+                (content.id, container_id),
+                countdown=settings.INSTAGRAM_POLL_INITIAL_DELAY
+            )
+            return {
+                "content_id": content.id,
+                "platform": content.platform.value,
+                "status": "processing",
+                "container_id": container_id
+            }
+        result = get_publisher(Platform.INSTAGRAM).publish_container(container_id, ledger=ledger)
+    elif content.platform == Platform.NEWSLETTER:
+        result = _publish_newsletter(content, ledger)
+    else:
+        raise ValueError(f"Unknown platform: {content.platform}")
+    
+    return _mark_published(db, content, result)
+
+
+def _mark_published(db, content: GeneratedContent, result: dict) -> dict:
+    """Store the published URL and return the task result"""
+    previous_status = content.approval_status.value
+    content.approval_status = ApprovalStatus.PUBLISHED
+    content.published_url = result.get("url")
+    content.published_at = datetime.now(timezone.utc)
+    
+    db.commit()
+    
+    logger.info(
+        "content_published",
+        content_id=content.id,
+        platform=content.platform.value,
+        url=result.get("url")
+    )
+    
+    invalidate_content([content.id])
+    publish_content_events([content_event("status_changed", content, previous_status=previous_status)])
+    _record_publishing_progress(db, content.source_id)
+    
+    return {
+        "content_id": content.id,
+        "platform": content.platform.value,
+        "status": "published",
+        "url": result.get("url")
+    }
+
+
+def _mark_failed(db, content_id: int, error: str, retry_count: int):
+    """Update error in database"""
+    db.rollback()
+    content = db.query(GeneratedContent).filter(
+        GeneratedContent.id == content_id
+    ).first()
+    if content:
+        previous_status = content.approval_status.value
+        content.approval_status = ApprovalStatus.FAILED
+        content.error_message = error
+        content.retry_count = retry_count
+        db.commit()
+        invalidate_content([content_id])
+        if previous_status != ApprovalStatus.FAILED.value:
+            publish_content_events([content_event("status_changed", content, previous_status=previous_status)])
+        record_stage(db, content.source_id, PipelineStage.PUBLISHING, ContentStatus.FAILED, error=error)
+
+
+def _record_publishing_progress(db, source_id: int):
+    """Publishing completes once no approved item of the source is left unpublished"""
+    statuses = {
+        status for (status,) in db.query(GeneratedContent.approval_status).filter(
+            GeneratedContent.source_id == source_id
+        ).distinct()
+    }
+    
+    if ApprovalStatus.FAILED in statuses:
+        status = ContentStatus.FAILED
+    elif ApprovalStatus.APPROVED in statuses:
+        status = ContentStatus.PROCESSING
     else:
-        # Fallback: split content by newlines
-        tweets = [t.strip() for t in content.content.split('\n\n') if t.strip()]
+        status = ContentStatus.COMPLETED
     
-    return publisher.publish_thread(tweets)
+    record_stage(db, source_id, PipelineStage.PUBLISHING, status)
+
+
+def _publish_twitter(content: GeneratedContent, ledger: PublishLedger) -> dict:
+    """Publish to Twitter"""
+    publisher = get_publisher(Platform.TWITTER)
+    
+    return publisher.publish_thread(_thread_tweets(content), ledger=ledger)
+
+
+def _thread_tweets(content: GeneratedContent) -> list:
+    """Tweets of a Twitter item, from content_parts or split on blank lines"""
+    if content.content_parts:
+        return json.loads(content.content_parts)
+    return [t.strip() for t in content.content.split('\n\n') if t.strip()]
 
 
-def _publish_linkedin(content: GeneratedContent) -> dict:
+def _publish_linkedin(content: GeneratedContent, ledger: PublishLedger) -> dict:
     """Publish to LinkedIn"""
-    publisher = LinkedInPublisher()
+    publisher = get_publisher(Platform.LINKEDIN)
     
     # Get media URLs if any
     media_urls = None
     if content.media_urls:
         media_urls = json.loads(content.media_urls)
     
-    return publisher.publish_post(content.content, media_urls)
+    return publisher.publish_post(content.content, media_urls, ledger=ledger)
 
 
-def _publish_instagram(content: GeneratedContent) -> dict:
-    """Publish to Instagram"""
-    publisher = InstagramPublisher()
+def _create_instagram_container(content: GeneratedContent, ledger: PublishLedger) -> str:
+    """Create (or reuse) the Instagram media container"""
+    publisher = get_publisher(Platform.INSTAGRAM)
     
     # Instagram requires an image
     image_url = None
@@ -157,17 +557,16 @@ def _publish_instagram(content: GeneratedContent) -> dict:
     if not image_url:
         raise ValueError("Instagram posts require an image URL")
     
-    return publisher.publish_post(content.content, image_url)
+    return publisher.create_container(content.content, image_url, ledger=ledger)
 
 
-def _publish_newsletter(content: GeneratedContent) -> dict:
+def _publish_newsletter(content: GeneratedContent, ledger: PublishLedger) -> dict:
     """Publish newsletter"""
-    publisher = NewsletterPublisher()
+    publisher = get_publisher(Platform.NEWSLETTER)
     
     # Extract subject line from metadata
     subject = "Newsletter"
-    if content.metadata:
-        metadata = json.loads(content.metadata)
-        subject = metadata.get("subject_line", subject)
+    if content.metadata_:
+        subject = content.metadata_.get("subject_line") or subject
     
-    return publisher.publish_newsletter(subject, content.content)
+    return publisher.publish_newsletter(subject, content.content, ledger=ledger)
@@ -0,0 +1,53 @@
+from celery.signals import task_prerun, task_postrun
+from app.metrics import TASK_QUEUE_WAIT_SECONDS, TASK_RUN_SECONDS
+from app.services import queue_stats
+from datetime import datetime
+import time
+
+# task_id -> (queue, start time) of tasks running in this process
+_running = {}
+
+
+def _queue(task) -> str:
+    """Queue the message came from (None for tasks called directly)"""
+    delivery_info = task.request.delivery_info or {}
+    return delivery_info.get("routing_key")
+
+
+def _ready_at(task) -> float:
+    """When the task could first have started: enqueue time, or its ETA if later"""
+    enqueued_at = getattr(task.request, "enqueued_at", None)
+    if enqueued_at is None:
+        return None
+
+    eta = task.request.eta
+    if eta:
+        return max(enqueued_at, datetime.fromisoformat(eta).timestamp())
+    return enqueued_at
+
+
+@task_prerun.connect
+def record_task_start(task_id=None, task=None, **kwargs):
+    queue = _queue(task)
+    if queue is None:
+        return
+
+    started = time.time()
+    ready_at = _ready_at(task)
+    if ready_at is not None:
+        TASK_QUEUE_WAIT_SECONDS.labels(queue, task.name).observe(max(started - ready_at, 0))
+
+    _running[task_id] = (queue, started)
+    queue_stats.task_started(queue, task_id)
+
+
+@task_postrun.connect
+def record_task_end(task_id=None, task=None, state=None, **kwargs):
+    entry = _running.pop(task_id, None)
+    if entry is None:
+        return
+
+    queue, started = entry
+    runtime = time.time() - started
+    TASK_RUN_SECONDS.labels(queue, task.name, state or "UNKNOWN").observe(runtime)
+    queue_stats.task_finished(queue, task_id, runtime)
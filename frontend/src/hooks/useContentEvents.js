@@ -0,0 +1,28 @@
+import { useEffect, useRef } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
+
+// Applies server-sent content events to a cached query with `applyEvent(data, event)`
+// instead of re-fetching it. Events missed while disconnected can't be replayed,
+// so the query is invalidated once whenever the stream reconnects.
+export default function useContentEvents(queryKey, applyEvent) {
+    const queryClient = useQueryClient()
+    const apply = useRef(applyEvent)
+    apply.current = applyEvent
+    const key = JSON.stringify(queryKey)
+
+    useEffect(() => {
+        const source = new EventSource('/api/content/events')
+        let connected = false
+
+        source.addEventListener('open', () => {
+            if (connected) queryClient.invalidateQueries({ queryKey })
+            connected = true
+        })
+        source.addEventListener('content', (message) => {
+            const event = JSON.parse(message.data)
+            queryClient.setQueryData(queryKey, (data) => data && apply.current(data, event))
+        })
+
+        return () => source.close()
+    }, [queryClient, key])
+}
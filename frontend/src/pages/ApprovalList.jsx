@@ -1,15 +1,24 @@
-import { useQuery } from '@tanstack/react-query'
+import { useInfiniteQuery } from '@tanstack/react-query'
 import { useNavigate } from 'react-router-dom'
 import axios from 'axios'
+import useContentEvents from '../hooks/useContentEvents'
 
 export default function ApprovalList() {
     const navigate = useNavigate()
 
-    const { data: content, isLoading, refetch } = useQuery({
+    const { data, isLoading, fetchNextPage, hasNextPage, isFetchingNextPage } = useInfiniteQuery({
         queryKey: ['pendingContent'],
-        queryFn: () => axios.get('/api/content/pending').then(res => res.data)
+        queryFn: ({ pageParam }) => axios.get('/api/content/pending', {
+            params: { cursor: pageParam || undefined }
+        }).then(res => res.data),
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage.next_cursor
     })
 
+    useContentEvents(['pendingContent'], applyPendingEvent)
+
+    const content = data?.pages.flatMap(page => page.items) || []
+
     if (isLoading) {
         return (
             <div style={{ display: 'flex', justifyContent: 'center', padding: 'var(--spacing-xl)' }}>
@@ -30,11 +39,11 @@ export default function ApprovalList() {
                     Approval Queue
                 </h1>
                 <span className="status-badge status-pending">
-                    {content?.length || 0} Pending
+                    {content.length}{hasNextPage ? '+' : ''} Pending
                 </span>
             </div>
 
-            {!content || content.length === 0 ? (
+            {content.length === 0 ? (
                 <div className="glass-card" style={{ textAlign: 'center', padding: 'var(--spacing-xl)' }}>
                     <p style={{ color: 'var(--text-secondary)' }}>
                         No content pending approval
@@ -49,12 +58,52 @@ export default function ApprovalList() {
                             onClick={() => navigate(`/approval/${item.id}`)}
                         />
                     ))}
+                    {hasNextPage && (
+                        <button
+                            className="btn-secondary"
+                            onClick={() => fetchNextPage()}
+                            disabled={isFetchingNextPage}
+                        >
+                            {isFetchingNextPage ? 'Loading...' : 'Load more'}
+                        </button>
+                    )}
                 </div>
             )}
         </div>
     )
 }
 
+// New items go to the top, edits patch the preview, anything leaving
+// pending_approval is dropped
+function applyPendingEvent(data, { type, item }) {
+    const exists = data.pages.some(page => page.items.some(existing => existing.id === item.id))
+    let pages
+
+    if (type === 'created' && item.approval_status === 'pending_approval') {
+        if (exists) return data
+        pages = data.pages.map((page, index) =>
+            index === 0 ? { ...page, items: [item, ...page.items] } : page
+        )
+    } else if (type === 'updated') {
+        pages = data.pages.map(page => ({
+            ...page,
+            items: page.items.map(existing =>
+                existing.id === item.id ? { ...existing, preview: item.preview } : existing
+            )
+        }))
+    } else if (type === 'status_changed' && item.approval_status !== 'pending_approval') {
+        if (!exists) return data
+        pages = data.pages.map(page => ({
+            ...page,
+            items: page.items.filter(existing => existing.id !== item.id)
+        }))
+    } else {
+        return data
+    }
+
+    return { ...data, pages }
+}
+
 function ContentCard({ content, onClick }) {
     const platformColors = {
         twitter: '#1DA1F2',
@@ -133,7 +182,7 @@ function ContentCard({ content, onClick }) {
                         WebkitLineClamp: 3,
                         WebkitBoxOrient: 'vertical'
                     }}>
-                        {content.content}
+                        {content.preview}
                     </p>
 
                     <button className="btn-primary" style={{ fontSize: '0.875rem', padding: '0.5rem 1rem' }}>
@@ -1,5 +1,6 @@
 import { useQuery } from '@tanstack/react-query'
 import axios from 'axios'
+import useContentEvents from '../hooks/useContentEvents'
 
 export default function Dashboard() {
     const { data, isLoading } = useQuery({
@@ -7,6 +8,8 @@ export default function Dashboard() {
         queryFn: () => axios.get('/api/dashboard/stats').then(res => res.data)
     })
 
+    useContentEvents(['dashboardStats'], applyStatsEvent)
+
     if (isLoading) {
         return (
             <div style={{ display: 'flex', justifyContent: 'center', padding: 'var(--spacing-xl)' }}>
@@ -108,6 +111,24 @@ function StatusRow({ label, value, color }) {
     )
 }
 
+// Moves one item between the content counters; statuses without a counter
+// (rejected, failed) only affect the total
+function applyStatsEvent(data, { type, item, previous_status }) {
+    if (!data.content || type === 'updated') return data
+
+    const content = { ...data.content }
+    if (type === 'created') {
+        content.total = (content.total || 0) + 1
+    } else if (previous_status in content) {
+        content[previous_status] = Math.max((content[previous_status] || 0) - 1, 0)
+    }
+    if (item.approval_status in content) {
+        content[item.approval_status] = (content[item.approval_status] || 0) + 1
+    }
+
+    return { ...data, content }
+}
+
 function calculateSuccessRate(data) {
     if (!data?.content) return 0
     const total = data.content.total || 0
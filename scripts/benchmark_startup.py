@@ -0,0 +1,90 @@
+"""
+Startup time and memory benchmark.
+
+Imports the API application and the Celery worker app (with its task
+modules) in fresh interpreters, several times each, and reports the median
+import time and peak RSS. Fails if the API process loads a worker module or
+one of the heavy SDKs, which should only be imported where they are used.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the API process must not import
+HEAVY_MODULES = [
+    "app.workers.ingestion",
+    "app.workers.content_generation",
+    "app.workers.publishing",
+    "app.workers.notifications",
+    "yt_dlp",
+    "youtube_transcript_api",
+    "tweepy",
+    "sendgrid",
+    "resend",
+    "openai",
+    "langgraph",
+    "langchain",
+]
+
+TARGETS = {
+    "api": "import app.main",
+    "worker": "from app.celery_app import celery_app; celery_app.loader.import_default_modules()",
+}
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "heavy": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failures = 0
+
+    for target, statement in TARGETS.items():
+        samples = [measure(statement) for _ in range(args.runs)]
+        seconds = statistics.median(sample["seconds"] for sample in samples)
+        rss = statistics.median(sample["max_rss_mb"] for sample in samples)
+        heavy = samples[-1]["heavy"]
+
+        print(f"{target:<8} import {seconds * 1000:8.1f} ms   peak RSS {rss:7.1f} MB")
+        print(f"         loaded: {', '.join(heavy) or '-'}")
+
+        if target == "api" and heavy:
+            failures += 1
+            print(f"FAIL  the API process imported {', '.join(heavy)}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Worker pool throughput benchmark.
+
+Runs a throwaway Celery worker per profile against Redis, pushes a batch of
+simulated I/O-bound tasks (a sleep standing in for an LLM, platform or
+email API call) and reports tasks per second. Compare the old single
+prefork worker with the per-queue profiles in docker-compose.yml.
+
+Usage:
+    python scripts/benchmark_worker_pools.py [--tasks 200] [--latency 0.5]
+
+BENCHMARK_REDIS_URL selects the broker (default redis://localhost:6379/15);
+the gevent profile is skipped unless gevent is installed.
+"""
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+
+from celery import Celery, group
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REDIS_URL = os.environ.get("BENCHMARK_REDIS_URL", "redis://localhost:6379/15")
+QUEUE = "pool_benchmark"
+
+bench_app = Celery("pool_benchmark", broker=REDIS_URL, backend=REDIS_URL)
+bench_app.conf.update(
+    task_default_queue=QUEUE,
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+)
+
+# name -> worker options
+PROFILES = {
+    "prefork-3 (previous default)": ["--pool=prefork", "--concurrency=3"],
+    "threads-16 (generation)": ["--pool=threads", "--concurrency=16"],
+    "threads-32 (publishing)": ["--pool=threads", "--concurrency=32"],
+    "gevent-64": ["--pool=gevent", "--concurrency=64"],
+}
+
+
+# Explicit name: the script runs as __main__ but the worker imports it by module path
+@bench_app.task(name="pool_benchmark.simulated_io")
+def simulated_io(latency: float) -> int:
+    time.sleep(latency)
+    return os.getpid()
+
+
+def wait_for_worker(hostname: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if any(hostname in reply for reply in bench_app.control.ping(timeout=0.5)):
+            return
+    raise RuntimeError(f"worker {hostname} did not start")
+
+
+def run_profile(name: str, options: list, tasks: int, latency: float) -> float:
+    hostname = f"bench-{os.getpid()}@localhost"
+    bench_app.control.purge()
+
+    worker = subprocess.Popen(
+        [
+            sys.executable, "-m", "celery",
+            "-A", "scripts.benchmark_worker_pools.bench_app",
+            "worker", "-Q", QUEUE, "-n", hostname, "--loglevel=warning",
+            *options,
+        ],
+        cwd=ROOT,
+    )
+    try:
+        wait_for_worker(hostname)
+
+        start = time.perf_counter()
+        group(simulated_io.s(latency) for _ in range(tasks)).apply_async().get(timeout=tasks * latency + 60)
+        elapsed = time.perf_counter() - start
+    finally:
+        worker.terminate()
+        worker.wait()
+
+    return tasks / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds of simulated I/O per task")
+    args = parser.parse_args()
+
+    for name, options in PROFILES.items():
+        if "--pool=gevent" in options and importlib.util.find_spec("gevent") is None:
+            print(f"{name:<30} skipped (gevent not installed)")
+            continue
+
+        throughput = run_profile(name, options, args.tasks, args.latency)
+        print(f"{name:<30} {throughput:8.1f} tasks/s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Approve -> publish_source claim check.
+
+Puts a source's items in the states the approve endpoint leaves them in
+(scheduled slot, or dispatched to publish_content right away) and checks
+that publish_source claims the scheduled one, leaves the dispatched one to
+its task, and claims nothing on a second run. Everything runs in one
+transaction that is rolled back.
+
+Usage:
+    alembic upgrade head
+    python scripts/check_publish_source_claim.py
+"""
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.models import SourceContent, GeneratedContent, ApprovalStatus, ContentStatus, Platform
+from app.workers.publishing import claim_source_items
+
+
+def main() -> int:
+    db = SessionLocal()
+    now = datetime.now(timezone.utc)
+    
+    try:
+        video_id = f"claim-check-{uuid.uuid4().hex[:8]}"
+        source = SourceContent(
+            video_url=f"https://www.youtube.com/watch?v={video_id}",
+            video_id=video_id,
+            status=ContentStatus.COMPLETED
+        )
+        # approve_content with SCHEDULED_PUBLISHING_ENABLED
+        scheduled = GeneratedContent(
+            source=source,
+            platform=Platform.LINKEDIN,
+            content="scheduled",
+            approval_status=ApprovalStatus.APPROVED,
+            publish_at=now + timedelta(hours=1)
+        )
+        # approve_content without scheduling: claimed for its publish_content task
+        dispatched = GeneratedContent(
+            source=source,
+            platform=Platform.TWITTER,
+            content="dispatched",
+            approval_status=ApprovalStatus.APPROVED,
+            dispatched_at=now
+        )
+        pending = GeneratedContent(
+            source=source,
+            platform=Platform.NEWSLETTER,
+            content="pending",
+            approval_status=ApprovalStatus.PENDING_APPROVAL
+        )
+        db.add_all([source, scheduled, dispatched, pending])
+        db.flush()
+        
+        failures = 0
+        
+        claimed = claim_source_items(db, source.id)
+        if claimed == [scheduled.id]:
+            print("ok    publish_source claims the approved, undispatched item")
+        else:
+            failures += 1
+            print(f"FAIL  expected to claim [{scheduled.id}], claimed {claimed}")
+        
+        claimed_again = claim_source_items(db, source.id)
+        if not claimed_again:
+            print("ok    a second run claims nothing")
+        else:
+            failures += 1
+            print(f"FAIL  second run claimed {claimed_again}")
+        
+        return 1 if failures else 0
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
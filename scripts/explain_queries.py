@@ -0,0 +1,122 @@
+"""
+Query-plan regression check.
+
+Runs EXPLAIN for the dashboard, approval and scheduler query shapes against
+the database in DATABASE_URL and fails if any of them stops using its index.
+Sequential scans are disabled for the session so the check is meaningful on
+small local databases too.
+
+Usage:
+    alembic upgrade head
+    python scripts/explain_queries.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+# (description, SQL, index the plan must use)
+QUERIES = [
+    (
+        "pending approval queue, newest first",
+        """
+        SELECT id, created_at FROM generated_content
+        WHERE approval_status = 'PENDING_APPROVAL'
+          AND (created_at, id) < (now(), 2147483647)
+        ORDER BY created_at DESC, id DESC LIMIT 21
+        """,
+        "ix_generated_content_pending_created_at_id",
+    ),
+    (
+        "recent content keyset page",
+        """
+        SELECT id, platform, approval_status, created_at FROM generated_content
+        WHERE (created_at, id) < (now(), 2147483647)
+        ORDER BY created_at DESC, id DESC LIMIT 11
+        """,
+        "ix_generated_content_created_at_id",
+    ),
+    (
+        "recent videos keyset page",
+        """
+        SELECT id, title, status, created_at FROM source_content
+        ORDER BY created_at DESC, id DESC LIMIT 11
+        """,
+        "ix_source_content_created_at_id",
+    ),
+    (
+        "videos by status",
+        """
+        SELECT id FROM source_content
+        WHERE status = 'PROCESSING' ORDER BY created_at DESC LIMIT 10
+        """,
+        "ix_source_content_status_created_at",
+    ),
+    (
+        "content stats by approval status",
+        """
+        SELECT approval_status, count(*) FROM generated_content GROUP BY approval_status
+        """,
+        "ix_generated_content_approval_status_created_at",
+    ),
+    (
+        "approved content of a source",
+        """
+        SELECT id FROM generated_content
+        WHERE source_id = 1 AND approval_status = 'APPROVED'
+        """,
+        "ix_generated_content_source_id_approval_status",
+    ),
+    (
+        "scheduler due rows",
+        """
+        SELECT id FROM generated_content
+        WHERE approval_status = 'APPROVED' AND publish_at IS NOT NULL AND dispatched_at IS NULL
+          AND publish_at <= now()
+        ORDER BY publish_at LIMIT 20
+        """,
+        "ix_generated_content_due_publish_at",
+    ),
+    (
+        "last scheduled slot per platform",
+        """
+        SELECT max(greatest(publish_at, published_at)) FROM generated_content
+        WHERE platform = 'TWITTER' AND approval_status IN ('APPROVED', 'PUBLISHED')
+        """,
+        "ix_generated_content_platform_last_slot",
+    ),
+    (
+        "source metadata containment",
+        """
+        SELECT id FROM source_content WHERE metadata @> '{"language": "en"}'
+        """,
+        "ix_source_content_metadata",
+    ),
+]
+
+
+def main() -> int:
+    failures = 0
+    
+    with engine.connect() as connection:
+        connection.execute(text("SET enable_seqscan = off"))
+        
+        for description, sql, index in QUERIES:
+            plan = "\n".join(
+                row[0] for row in connection.execute(text(f"EXPLAIN {sql}"))
+            )
+            if index in plan and "Seq Scan" not in plan:
+                print(f"ok    {description} ({index})")
+            else:
+                failures += 1
+                print(f"FAIL  {description}: expected {index}\n{plan}\n")
+    
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())